@@ -164,10 +164,9 @@ def total_firing_rate(network=None, spike_detector=None, nodes=None, data=None,
 
     rate = np.zeros(len(times))
 
-    # counts the spikes at each time
+    # counts the spikes at each time (one bin per index of `times`)
     pos = find_idx_nearest(times, data[:, 1])
-    bins = np.linspace(0, len(times), len(times)+1)
-    counts, _ = np.histogram(pos, bins=bins)
+    counts = np.bincount(pos, minlength=len(times))
 
     # initialize with delta rate in Hz
     rate += 1000. * counts / (kernel_std*np.sqrt(np.pi))
@@ -238,7 +238,7 @@ class Graph(nngt.core.GraphObject):
         '''
         fmt = _get_format(fmt, filename)
 
-        if fmt not in di_get_edges:
+        if fmt not in di_get_edges and fmt != "csr":
             # only partial support for these formats, relying on backend
             libgraph = _library_load(filename, fmt)
 
@@ -232,8 +232,10 @@ class Structure(OrderedDict):
         state = super().__reduce__()
         last  = state[4] if len(state) == 5 else None
         dic   = state[2]
-        args  = (dic.get("_size", None), dic.get("_parent", None),
-                    dic.get("_meta_groups", {}))
+
+        # the parent is stored as a weakref in `dic` and restored from there
+        # (copies keep it, graph_saving replaces weakrefs by None)
+        args  = (dic.get("_size", None), None, dic.get("_meta_groups", {}))
 
         newstate = (Structure, args, dic, None, last)
 
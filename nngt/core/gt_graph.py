@@ -828,7 +828,10 @@ class _GtGraph(GraphInterface):
 
     def clear_all_edges(self):
         ''' Remove all edges from the graph '''
-        self._graph.clear_edges()
+        if self._graph.num_edges():
+            self._graph.clear_edges()
+
+        self._max_eid = 0
         self._eattr.clear()
 
     #-------------------------------------------------------------------------#
@@ -601,7 +601,9 @@ class _IGraph(GraphInterface):
 
     def clear_all_edges(self):
         ''' Remove all edges from the graph '''
-        self._graph.delete_edges()
+        if self._graph.ecount():
+            self._graph.delete_edges()
+
         self._eattr.clear()
 
     #-------------------------------------------------------------------------#
@@ -306,7 +306,7 @@ class _NNGTGraphObject:
 
     def __init__(self, nodes=0, weighted=True, directed=True):
         ''' Initialized independent graph '''
-        self._nodes    = set(i for i in range(nodes))
+        self._nodes    = set(range(nodes))
         self._out_deg  = [0]*nodes
         self._in_deg   = [0]*nodes
 
@@ -811,36 +811,33 @@ class _NNGTGraph(GraphInterface):
 
             # create the edges
             initial_eid = self._max_eid
+            num_added   = len(edge_list)
 
-            ws        = None
-            num_added = len(edge_list)
+            self._max_eid += num_added
 
-            if "weight" in new_attr:
-                if nonstring_container(new_attr["weight"]):
-                    ws = new_attr["weight"]
-                else:
-                    ws = (new_attr["weight"] for _ in range(num_added))
-            else:
-                ws = _get_edge_attr(self, edge_list, "weight", last_edges=True)
+            if num_added:
+                ia_edges = np.asarray(edge_list, dtype=int).reshape(-1, 2)
+                lst_edges = [tuple(e) for e in ia_edges.tolist()]
+                eids = range(initial_eid, self._max_eid)
 
-            for i, (e, w) in enumerate(zip(edge_list, ws)):
-                eid = self._max_eid
+                g._unique.update(zip(lst_edges, eids))
 
-                g._unique[tuple(e)] = eid
+                num_nodes = len(g._out_deg)
 
-                self._max_eid += 1
-
-                g._out_deg[e[0]] += 1
-                g._in_deg[e[1]]  += 1
+                out_deg = np.bincount(ia_edges[:, 0], minlength=num_nodes)
+                in_deg  = np.bincount(ia_edges[:, 1], minlength=num_nodes)
 
                 if not g._directed:
-                    # edges and unique are different objects, so update _edges
-                    g._edges[tuple(e)] = eid
-                    # reciprocal edge
-                    g._edges[tuple(e[::-1])] = eid
+                    # edges and unique are different objects, so update
+                    # _edges with both directions
+                    for e, eid in zip(lst_edges, eids):
+                        g._edges[e] = eid
+                        g._edges[e[::-1]] = eid
+
+                    out_deg, in_deg = out_deg + in_deg, in_deg + out_deg
 
-                    g._out_deg[e[1]] += 1
-                    g._in_deg[e[0]]  += 1
+                g._out_deg = (np.asarray(g._out_deg) + out_deg).tolist()
+                g._in_deg  = (np.asarray(g._in_deg) + in_deg).tolist()
 
             # check distance
             _set_dist_new_edges(new_attr, self, edge_list)
@@ -899,16 +896,19 @@ class _NNGTGraph(GraphInterface):
     def clear_all_edges(self):
         g = self._graph
 
-        if g._directed:
-            g._edges = g._unique = OrderedDict()
-            assert g._edges is g._unique
-        else:
-            g._edges  = OrderedDict()
-            g._unique = OrderedDict()
+        # nothing to reset in the graph object if it has no edges
+        if g._unique:
+            if g._directed:
+                g._edges = g._unique = OrderedDict()
+                assert g._edges is g._unique
+            else:
+                g._edges  = OrderedDict()
+                g._unique = OrderedDict()
 
-        g._out_deg = [0 for _ in range(self.node_nb())]
-        g._out_deg = [0 for _ in range(self.node_nb())]
+            g._out_deg = [0]*self.node_nb()
+            g._in_deg  = [0]*self.node_nb()
 
+        self._max_eid = 0
         self._eattr.clear()
 
     #------------------------------------------------------------------#
@@ -730,7 +730,14 @@ class _NxGraph(GraphInterface):
     def clear_all_edges(self):
         ''' Remove all edges from the graph '''
         g = self._graph
-        g.remove_edges_from(tuple(g.edges()))
+
+        if hasattr(g, "clear_edges"):
+            # networkx >= 2.5, drops the adjacency dicts in O(N)
+            g.clear_edges()
+        else:
+            g.remove_edges_from(tuple(g.edges()))
+
+        self._max_eid = 0
         self._eattr.clear()
 
     #-------------------------------------------------------------------------#
@@ -13,6 +13,7 @@ cimport numpy as cnp
 
 import numpy as np
 import scipy.sparse as ssp
+from scipy.spatial import cKDTree
 from numpy.random import randint, get_state
 
 import nngt
@@ -451,11 +452,19 @@ def _gaussian_degree(cnp.ndarray[size_t, ndim=1] source_ids,
         # type of degree
         bool b_total = (degree_type == "total")
         size_t num_source = source_ids.shape[0]
-        uint64_t[:] degrees = np.around(np.maximum(
-            rng.normal(avg, std, num_source), 0)).astype(np.uint64)
-        size_t edges = np.sum(degrees)
+        uint64_t[:] degrees
+        size_t edges
         int idx
 
+    # clip and round in place
+    raw_degrees = rng.normal(avg, std, num_source)
+
+    np.maximum(raw_degrees, 0., out=raw_degrees)
+    np.around(raw_degrees, out=raw_degrees)
+
+    degrees = raw_degrees.astype(np.uint64)
+    edges   = np.sum(degrees)
+
     if b_total or not directed:
         # check that the sum of the degrees is even
         if edges % 2 != 0:
@@ -476,7 +485,7 @@ def _distance_rule(cnp.ndarray[size_t, ndim=1] source_ids,
                    cnp.ndarray[size_t, ndim=1] target_ids, density=None,
                    edges=None, avg_deg=None, float scale=-1., str rule="exp",
                    float max_proba=-1., shape=None,
-                   cnp.ndarray[float, ndim=2] positions=np.array([[0], [0]]),
+                   positions=np.array([[0.], [0.]]),
                    bool directed=True, bool multigraph=False,
                    num_neurons=None, distance=None, **kwargs):
     '''
@@ -484,6 +493,10 @@ def _distance_rule(cnp.ndarray[size_t, ndim=1] source_ids,
     '''
     distance = [] if distance is None else distance
 
+    # edges are drawn in single precision, their lengths are computed in
+    # double precision from the original positions
+    positions = np.asarray(positions, dtype=float)
+
     if num_neurons is None:
         num_neurons = len(set(np.concatenate((source_ids, target_ids))))
 
@@ -499,8 +512,8 @@ def _distance_rule(cnp.ndarray[size_t, ndim=1] source_ids,
         cnp.ndarray[long, ndim=1] loc_tgts
         list sources = []
         list targets = []
-        vector[float] x = positions[0]
-        vector[float] y = positions[1]
+        vector[float] x = positions[0].astype(np.float32)
+        vector[float] y = positions[1].astype(np.float32)
         float cscale = scale
 
     # compute the required values
@@ -517,14 +530,19 @@ def _distance_rule(cnp.ndarray[size_t, ndim=1] source_ids,
 
     # for each node, check the neighbours that are in an area where
     # connections can be made: +/- scale for lin, +/- 10*scale for exp
+    # candidate targets are obtained from a KD-tree on the target positions
     lim = scale if rule == 'lin' else 10*scale
-    for i in source_ids:
-        keep  = (np.abs(positions[0, target_ids] - positions[0, i]) < lim)
-        keep *= (np.abs(positions[1, target_ids] - positions[1, i]) < lim)
+
+    tree = cKDTree(positions[:, target_ids].T)
+
+    neighbours = tree.query_ball_point(
+        positions[:, source_ids].T, r=lim, return_sorted=True)
+
+    for src, nn in zip(source_ids, neighbours):
+        tgts = target_ids[np.asarray(nn, dtype=int)]
         if b_one_pop:
-            idx = np.where(target_ids == i)[0][0]
-            keep[idx] = 0
-        local_targets.push_back(target_ids[keep].tolist())
+            tgts = tgts[tgts != src]
+        local_targets.push_back(tgts.tolist())
 
     # create the edges
     cdef:
@@ -538,7 +556,10 @@ def _distance_rule(cnp.ndarray[size_t, ndim=1] source_ids,
         _cdistance_rule(&ia_edges[0,0], source_ids, local_targets, crule,
                         cscale, 1., x, y, cnum_neurons, cedges, old_edges,
                         dist, multigraph, directed, seeds)
-        distance.extend(dist)
+        edges_arr = np.asarray(ia_edges)
+        distance.extend(np.hypot(
+            positions[0, edges_arr[:, 1]] - positions[0, edges_arr[:, 0]],
+            positions[1, edges_arr[:, 1]] - positions[1, edges_arr[:, 0]]))
         return ia_edges
 
     for i, s in enumerate(source_ids):
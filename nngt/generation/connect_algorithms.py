@@ -8,7 +8,7 @@
 import logging
 import numpy as np
 import scipy.sparse as ssp
-from numpy.random import randint
+from scipy.spatial import cKDTree
 
 import nngt
 from nngt.lib import InvalidArgument
@@ -34,6 +34,8 @@ logger = logging.getLogger(__name__)
 
 MAXTESTS = 1000 # ensure that generation will finish
 EPS = 0.00001
+CHUNK = 65536   # max number of candidate edges tested at once
+DENSE = 0.1     # density above which edges are drawn without replacement
 
 
 # ---------------------- #
@@ -270,7 +272,6 @@ def _from_degree_list(source_ids, target_ids, degree_list, degree_type="in",
             source_ids, target_ids, edges, directed, multigraph)
 
         num_einit  = 0 if existing_edges is None else existing_edges.shape[0]
-        num_etotal = num_einit
 
         ia_edges = np.full((num_einit + edges, 2), -1, dtype=int)
 
@@ -279,55 +280,79 @@ def _from_degree_list(source_ids, target_ids, degree_list, degree_type="in",
 
         idx = 0 if b_out else 1  # differenciate source / target
 
-        # keep track of degrees for undirected case
-        target_degrees  = {}
-        current_targets = {u: [] for u in source_ids}
+        degree_list = np.asarray(degree_list, dtype=int)
 
-        for u, d in zip(source_ids, degree_list):
-            if existing_edges is not None:
-                current_targets[u].extend(
-                    existing_edges[existing_edges[:, idx] == u, 1 - idx])
+        # position of each node among the targets (to avoid self-loops)
+        self_pos, has_self = _positions_in(source_ids, target_ids)
+        self_pos[~has_self] = num_target
+
+        num_avail = num_target - has_self
+
+        # check that there are enough targets left
+        if not multigraph:
+            num_existing = np.zeros(num_source, dtype=int)
+
+            if num_einit:
+                pos, found = _positions_in(existing_edges[:, idx], source_ids)
+                num_existing = np.bincount(pos[found], minlength=num_source)
+
+            invalid = num_avail - num_existing < degree_list
+
+            if np.any(invalid):
+                u = np.where(invalid)[0][0]
 
-            if not multigraph and (num_target - len(current_targets[u]) < d):
                 raise RuntimeError(
                     ("Node {node} already has a degree {d0} which means that "
                      "there are not enough targets left to add {d} edges."
-                    ).format(node=u, d0=len(current_targets[u]), target=d))
+                    ).format(node=source_ids[u], d0=num_existing[u],
+                             d=degree_list[u]))
+
+        # draw all the targets at once, excluding the node itself, then
+        # redraw only those which are duplicates if necessary
+        nodes_v   = np.repeat(source_ids, degree_list)
+        self_pos  = np.repeat(self_pos, degree_list)
+        num_avail = np.repeat(num_avail, degree_list)
 
-            target_degrees[u] = d
+        targets_v = np.empty(len(nodes_v), dtype=int)
 
         rng = nngt._rng
 
-        # create new connections
-        for v, degree_v in target_degrees.items():
-            existing_v = current_targets[v]
-            targets_v  = [] # where the targets will be stored
+        # existing edges can involve nodes outside of sources and targets
+        max_id = int(max(source_ids.max(), target_ids.max(),
+                         existing_edges.max() if num_einit else 0)) + 1
+
+        seen = np.empty(0, dtype=np.int64)
 
-            # set targets
-            rm = np.where(target_ids == v)[0]
-            rm = rm[0] if len(rm) else -1
+        if num_einit:
+            seen = np.unique(
+                existing_edges[:, idx].astype(np.int64)*max_id
+                + existing_edges[:, 1 - idx])
+
+        todo = np.arange(len(nodes_v))
 
-            tgts = (target_ids if rm == -1 else
-                    np.concatenate((target_ids[:rm], target_ids[rm+1:])))
+        while len(todo):
+            draws = rng.integers(0, num_avail[todo])
+            draws[draws >= self_pos[todo]] += 1
 
-            # select targets
-            while len(targets_v) < degree_v:
-                var = rng.choice(tgts, degree_v - len(targets_v),
-                                 replace=multigraph)
+            targets_v[todo] = target_ids[draws]
 
-                targets_v.extend(var)
+            if multigraph:
+                break
 
-                if not multigraph:
-                    s = set(existing_v + targets_v)
+            # keep only the first occurrence of each new edge
+            keys = nodes_v[todo].astype(np.int64)*max_id + targets_v[todo]
 
-                    targets_v  = list(s.difference(existing_v))
-                    existing_v = list(s)
+            _, first = np.unique(keys, return_index=True)
 
+            keep = np.zeros(len(todo), dtype=bool)
+            keep[first] = True
+            keep[np.isin(keys, seen)] = False
 
-            ia_edges[num_etotal:num_etotal + degree_v, idx] = v
-            ia_edges[num_etotal:num_etotal + degree_v, 1 - idx] = targets_v
+            seen = np.union1d(seen, keys[keep])
+            todo = todo[~keep]
 
-            num_etotal += degree_v
+        ia_edges[num_einit:, idx] = nodes_v
+        ia_edges[num_einit:, 1 - idx] = targets_v
 
         return ia_edges[num_einit:]
 
@@ -374,8 +399,13 @@ def _gaussian_degree(source_ids, target_ids, avg, std, degree_type="in",
     # edges (we set the in, out, or total degree of the source neurons)
     rng = nngt._rng
 
-    degrees = np.around(
-        np.maximum(rng.normal(avg, std, num_source), 0.)).astype(int)
+    # clip and round in place, the degrees are drawn in a single pass
+    degrees = rng.normal(avg, std, num_source)
+
+    np.maximum(degrees, 0., out=degrees)
+    np.around(degrees, out=degrees)
+
+    degrees = degrees.astype(int)
 
     if b_total or not directed:
         # check that the sum of the degrees is even
@@ -406,14 +436,18 @@ def _random_scale_free(source_ids, target_ids, in_exp, out_exp, density=None,
     b_one_pop = _check_num_edges(
         source_ids, target_ids, edges, directed, multigraph)
 
+    # existing edges are stored as sorted int64 keys (see _filter_packed)
+    max_id = max(source_ids.max(), target_ids.max()) + 1 if edges else 1
+
     arr_edges = np.full((edges, 2), -1, dtype=int)
     num_ecurrent, num_test = 0, 0
-    edges_hash = set()
-    recip_hash = None if not directed else set()
+    edges_keys = np.empty(0, dtype=np.int64)
+
+    rng = nngt._rng
 
     # lists containing the in/out-degrees for all nodes
-    in_deg = np.random.pareto(in_exp, num_target) + 1
-    out_deg = np.random.pareto(out_exp, num_source) + 1
+    in_deg = rng.pareto(in_exp, num_target) + 1
+    out_deg = rng.pareto(out_exp, num_source) + 1
 
     sum_in, sum_out = np.sum(in_deg), np.sum(out_deg)
 
@@ -429,8 +463,8 @@ def _random_scale_free(source_ids, target_ids, in_exp, out_exp, density=None,
         diff_in  = sum_in - pre_recip_edges
         diff_out = sum_out - pre_recip_edges
 
-        idx_correct_in = randint(0, num_target, np.abs(diff_in))
-        idx_correct_out = randint(0, num_source, np.abs(diff_out))
+        idx_correct_in = rng.integers(0, num_target, np.abs(diff_in))
+        idx_correct_out = rng.integers(0, num_source, np.abs(diff_out))
         in_deg[idx_correct_in] -= 1*np.sign(diff_in)
         out_deg[idx_correct_out] -= 1*np.sign(diff_out)
         in_deg[in_deg < 0] = 0
@@ -441,34 +475,30 @@ def _random_scale_free(source_ids, target_ids, in_exp, out_exp, density=None,
     sources = np.repeat(source_ids, out_deg)
     targets = np.repeat(target_ids, in_deg)
 
-    np.random.shuffle(targets)
-
-    arr_edges_tmp = np.array((sources, targets)).T
+    rng.shuffle(targets)
 
-    arr_edges, num_ecurrent = _filter(arr_edges, arr_edges_tmp, num_ecurrent,
-                                     edges_hash, b_one_pop, multigraph,
-                                     directed=directed, recip_hash=recip_hash)
+    arr_edges, num_ecurrent, edges_keys = _filter_packed(
+        arr_edges, (sources, targets), num_ecurrent, edges_keys, max_id,
+        b_one_pop, multigraph, directed=directed)
 
     while num_ecurrent != pre_recip_edges and num_test < MAXTESTS:
         num_desired = pre_recip_edges-num_ecurrent
-        sources_tmp = np.random.choice(sources, num_desired)
-        targets_tmp = np.random.choice(targets, num_desired)
-        arr_edges_tmp = np.array([sources_tmp, targets_tmp]).T
-        arr_edges, num_ecurrent = _filter(
-            arr_edges, arr_edges_tmp, num_ecurrent, edges_hash, b_one_pop,
-            multigraph, directed=directed, recip_hash=recip_hash)
+        sources_tmp = rng.choice(sources, num_desired)
+        targets_tmp = rng.choice(targets, num_desired)
+        arr_edges, num_ecurrent, edges_keys = _filter_packed(
+            arr_edges, (sources_tmp, targets_tmp), num_ecurrent, edges_keys,
+            max_id, b_one_pop, multigraph, directed=directed)
         num_test += 1
 
     if directed and reciprocity > 0:
         while num_ecurrent != edges and num_test < MAXTESTS:
-            keep = np.random.choice(num_ecurrent, edges-num_ecurrent,
-                                    replace=multigraph)
-            arr_edges[num_ecurrent:] = arr_edges[keep]
-            num_ecurrent = edges
-            if not multigraph:
-                arr_edges_tmp = _unique_rows(arr_edges)
-                num_ecurrent = arr_edges_tmp.shape[0]
-                arr_edges[:num_ecurrent,:] = arr_edges_tmp
+            keep = rng.choice(num_ecurrent, edges-num_ecurrent,
+                              replace=multigraph)
+            # add the reciprocal of the chosen edges, only testing the new
+            # ones against the existing keys
+            arr_edges, num_ecurrent, edges_keys = _filter_packed(
+                arr_edges, arr_edges[keep, ::-1], num_ecurrent, edges_keys,
+                max_id, b_one_pop, multigraph, directed=directed)
             num_test += 1
 
     return arr_edges
@@ -491,32 +521,67 @@ def _erdos_renyi(source_ids, target_ids, density=None, edges=None,
     b_one_pop = _check_num_edges(
         source_ids, target_ids, edges, directed, multigraph)
 
+    rng = nngt._rng
+
+    # existing edges are stored as sorted int64 keys (see _filter_packed)
+    max_id = max(source_ids.max(), target_ids.max()) + 1 if edges else 1
+
     ia_edges = np.full((edges, 2), -1, dtype=int)
     num_test, num_ecurrent = 0, 0 # number of tests and current number of edges
-    edges_hash = set()
-    recip_hash = None if directed else set()
+    edges_keys = np.empty(0, dtype=np.int64)
+
+    num_pairs = num_source*num_target
+
+    if directed and not multigraph and pre_recip_edges > DENSE*num_pairs:
+        # dense graph: draw all edges at once among the allowed flat indices
+        # instead of rejecting duplicates
+        excluded = np.empty(0, dtype=np.int64)
+
+        if b_one_pop:
+            tgt_pos = np.empty(max_id, dtype=np.int64)
+            tgt_pos[target_ids] = np.arange(num_target)
+
+            excluded = np.arange(num_source)*num_target + tgt_pos[source_ids]
+            excluded.sort()
+
+        flat = rng.choice(num_pairs - len(excluded), pre_recip_edges,
+                          replace=False)
+
+        # skip the self-loops (excluded indices)
+        flat += np.searchsorted(excluded - np.arange(len(excluded)), flat,
+                                side="right")
+
+        ia_edges[:pre_recip_edges, 0] = source_ids[flat // num_target]
+        ia_edges[:pre_recip_edges, 1] = target_ids[flat % num_target]
+
+        num_ecurrent = pre_recip_edges
+
+        edges_keys = np.sort(
+            _pack_edges(ia_edges[:num_ecurrent], max_id, directed))
 
     while num_ecurrent != pre_recip_edges and num_test < MAXTESTS:
-        ia_sources = source_ids[randint(0, num_source,
-                                        pre_recip_edges-num_ecurrent)]
-        ia_targets = target_ids[randint(0, num_target,
-                                        pre_recip_edges-num_ecurrent)]
-        ia_edges_tmp = np.array([ia_sources,ia_targets]).T
-        ia_edges, num_ecurrent = _filter(
-            ia_edges, ia_edges_tmp, num_ecurrent, edges_hash, b_one_pop,
-            multigraph, directed=directed, recip_hash=recip_hash)
+        num_missing = pre_recip_edges - num_ecurrent
+
+        # draw flat indices in the (source, target) grid
+        flat = rng.integers(0, num_source*num_target, num_missing)
+
+        sources_tmp = source_ids[flat // num_target]
+        targets_tmp = target_ids[flat % num_target]
+
+        ia_edges, num_ecurrent, edges_keys = _filter_packed(
+            ia_edges, (sources_tmp, targets_tmp), num_ecurrent, edges_keys,
+            max_id, b_one_pop, multigraph, directed=directed)
         num_test += 1
 
     if directed and reciprocity > 0:
         while num_ecurrent != edges and num_test < MAXTESTS:
-            ia_indices = randint(0, pre_recip_edges,
-                                           edges-num_ecurrent)
-            ia_edges[num_ecurrent:] = ia_edges[ia_indices]
-            num_ecurrent = edges
-            if not multigraph:
-                ia_edges_tmp = _unique_rows(ia_edges)
-                num_ecurrent = ia_edges_tmp.shape[0]
-                ia_edges[:num_ecurrent,:] = ia_edges_tmp
+            ia_indices = rng.integers(0, pre_recip_edges,
+                                      edges-num_ecurrent)
+            # add the reciprocal of the chosen edges, only testing the new
+            # ones against the existing keys
+            ia_edges, num_ecurrent, edges_keys = _filter_packed(
+                ia_edges, ia_edges[ia_indices, ::-1], num_ecurrent,
+                edges_keys, max_id, b_one_pop, multigraph, directed=directed)
             num_test += 1
 
     return ia_edges
@@ -540,6 +605,9 @@ def _price_scale_free(ids, m, c, gamma, reciprocity, directed, multigraph,
 
     assert 0 <= reciprocity <= 1, "`reciprocity` must be in [0, 1]."
 
+    if gamma == 1 and c >= 0:
+        return _price_linear(ids, m, c, reciprocity, directed)
+
     in_degrees = np.zeros(num_nodes)
 
     edges = []
@@ -583,7 +651,65 @@ def _price_scale_free(ids, m, c, gamma, reciprocity, directed, multigraph,
                     edges.append(e[::-1])
                     in_degrees[i] += 1
 
-    return edges
+    return np.array(edges, dtype=int).reshape(-1, 2)
+
+
+def _price_linear(ids, m, c, reciprocity, directed):
+    '''
+    Price network with linear preferential attachment (``gamma = 1``).
+
+    Following Batagelj and Brandes, a target is chosen proportionally to its
+    in-degree by picking a uniform entry in the array of previous edge ends,
+    which avoids computing the full probability vector for each new node.
+    '''
+    num_nodes = len(ids)
+
+    rng = nngt._rng
+
+    # each node appears once per unit of in-degree (degree if undirected)
+    ends = np.empty(2*m*num_nodes, dtype=int)
+    num_ends = 0
+
+    edges = []
+
+    for i in range(1, num_nodes):
+        m_i = min(i, m)
+
+        # probability to attach via the degree rather than via `c`
+        p_deg = num_ends / (num_ends + c*i) if num_ends else 0
+
+        targets = []
+
+        while len(targets) < m_i:
+            if rng.random() < p_deg:
+                t = ends[rng.integers(num_ends)]
+            else:
+                t = rng.integers(i)
+
+            if t not in targets:
+                targets.append(t)
+
+        n = ids[i]
+
+        for t in targets:
+            edges.append((n, ids[t]))
+            ends[num_ends] = t
+            num_ends += 1
+
+            if not directed:
+                ends[num_ends] = i
+                num_ends += 1
+
+        if directed and reciprocity > 0:
+            make_recip = rng.random(m) < reciprocity
+
+            for b, t in zip(make_recip, targets):
+                if b:
+                    edges.append((ids[t], n))
+                    ends[num_ends] = i
+                    num_ends += 1
+
+    return np.array(edges, dtype=int).reshape(-1, 2)
 
 
 def _circular(source_ids, target_ids, coord_nb, reciprocity=1, directed=True,
@@ -664,8 +790,8 @@ def _circular_directed_recip(node_ids, coord_nb, reciprocity,
 
             # chose randomly the remaining connections
             stop = min(rounds + nodes, edges)
-            chosen = rng.choice([i for i in range(rounds, stop)],
-                                size=remainder, replace=False)
+            chosen = rng.choice(np.arange(rounds, stop), size=remainder,
+                                replace=False)
 
             sources[-num_recip + rounds:] = targets[chosen]
             targets[-num_recip + rounds:] = sources[chosen]
@@ -686,7 +812,7 @@ def _circular_directed_recip(node_ids, coord_nb, reciprocity,
             start = stop
             stop  = min(rounds + nodes, edges)
 
-            chosen = rng.choice(list(range(rounds, stop)), size=remainder,
+            chosen = rng.choice(np.arange(rounds, stop), size=remainder,
                                 replace=False)
 
             sources[start:] = targets[chosen]
@@ -704,11 +830,7 @@ def _circular_full(node_ids, coord_nb, directed, **kwargs):
     out_deg = coord_nb if directed else dist
 
     # create the graph using a continuous range from zero
-    sources = np.tile(np.arange(0, nodes).astype(int), out_deg)
-
-    # prepare conversion dict if nodes do not start from zero or are not
-    # contiguous. Initial generation assumes continuous range from zero
-    convertor = {i: n for i, n in enumerate(node_ids)}
+    sources = np.tile(np.arange(0, nodes, dtype=int), out_deg)
 
     # create the connection mask
     start = -dist if directed else 0
@@ -722,9 +844,12 @@ def _circular_full(node_ids, coord_nb, directed, **kwargs):
     targets[targets < 0] += nodes
     targets[targets >= nodes] -= nodes
 
-    # convert back to ids
-    sources = np.array([convertor[i] for i in sources])
-    targets = np.array([convertor[i] for i in targets])
+    # convert back to ids (nodes may not start from zero or may not be
+    # contiguous)
+    node_ids = np.asarray(node_ids, dtype=int)
+
+    sources = node_ids[sources]
+    targets = node_ids[targets]
 
     return np.array((sources, targets), dtype=int).T
 
@@ -775,11 +900,19 @@ def _newman_watts(source_ids, target_ids, coord_nb, proba_shortcut,
 
     # add the random connections
     num_test, num_ecurrent = 0, circular_edges
-    edges_hash = set(tuple(e) for e in ia_edges[:circular_edges])
-    recip_hash = None
 
-    if not directed:
-        recip_hash = set((tuple(e) for e in ia_edges[:circular_edges, ::-1]))
+    # existing edges are stored as sorted int64 keys (see _filter_packed)
+    max_id = int(source_ids.max()) + 1
+
+    circ_sources = ia_edges[:circular_edges, 0].astype(np.int64)
+    circ_targets = ia_edges[:circular_edges, 1].astype(np.int64)
+
+    if directed:
+        edges_keys = np.unique(circ_sources*max_id + circ_targets)
+    else:
+        edges_keys = np.unique(
+            np.minimum(circ_sources, circ_targets)*max_id
+            + np.maximum(circ_sources, circ_targets))
 
     rng = nngt._rng
 
@@ -787,9 +920,9 @@ def _newman_watts(source_ids, target_ids, coord_nb, proba_shortcut,
         todo   = edges - num_ecurrent
         chosen = rng.choice(source_ids, int(2*todo))
 
-        ia_edges, num_ecurrent = _filter(
-            ia_edges, chosen.reshape(todo, 2), num_ecurrent, edges_hash,
-            b_one_pop, multigraph, directed=directed, recip_hash=recip_hash)
+        ia_edges, num_ecurrent, edges_keys = _filter_packed(
+            ia_edges, chosen.reshape(todo, 2), num_ecurrent, edges_keys,
+            max_id, b_one_pop, multigraph, directed=directed)
 
         num_test += 1
 
@@ -933,8 +1066,7 @@ def _distance_rule(source_ids, target_ids, density=None, edges=None,
     Returns a distance-rule graph
     '''
     distance = [] if distance is None else distance
-    edges_hash = set()
-    recip_hash = None if directed else set()
+    edges_keys = np.empty(0, dtype=np.int64)
 
     # compute the required values
     source_ids = np.array(source_ids).astype(int)
@@ -953,28 +1085,40 @@ def _distance_rule(source_ids, target_ids, density=None, edges=None,
 
     num_neurons = len(set(np.concatenate((source_ids, target_ids))))
 
+    # upper bound on node ids, used to pack edges into int64 keys
+    max_id = int(max(source_ids.max(), target_ids.max())) + 1
+
+    # store positions as one contiguous array per axis; single precision
+    # is enough to draw the edges, the lengths of the accepted edges are then
+    # computed in double precision from the original positions
+    pos_x = np.ascontiguousarray(positions[0], dtype=np.float32)
+    pos_y = np.ascontiguousarray(positions[1], dtype=np.float32)
+
     # for each node, check the neighbours that are in an area where
-    # connections can be made: +/- scale for lin, +/- 10*scale for exp.
-    # Get the sources and associated targets for each MPI process
+    # connections can be made: scale for lin, 10*scale for exp.
+    # Candidate targets are obtained from a KD-tree on the target positions
+    # so that only neighbours within this radius are ever tested.
     list_targets = []
     lim = scale if rule == 'lin' else 10*scale
 
-    for s in source_ids:
-        keep  = (np.abs(positions[0, target_ids] - positions[0, s]) < lim)
-        keep *= (np.abs(positions[1, target_ids] - positions[1, s]) < lim)
+    tree = cKDTree(np.column_stack((pos_x[target_ids], pos_y[target_ids])))
+
+    neighbours = tree.query_ball_point(
+        np.column_stack((pos_x[source_ids], pos_y[source_ids])), r=lim,
+        return_sorted=True)
+
+    for s, nn in zip(source_ids, neighbours):
+        tgts = target_ids[np.asarray(nn, dtype=int)]
         if b_one_pop:
-            idx = np.where(target_ids == s)[0][0]
-            keep[idx] = 0
-        list_targets.append(target_ids[keep])
+            tgts = tgts[tgts != s]
+        list_targets.append(tgts)
 
     # the number of trials should be done depending on the number of
     # neighbours that each node has, so compute this number
-    tot_neighbours = 0
+    num_neighbours = np.array([len(tgts) for tgts in list_targets], dtype=int)
+    tot_neighbours = int(num_neighbours.sum())
     neigh_norm     = 1.
 
-    for tgt_list in list_targets:
-        tot_neighbours += len(tgt_list)
-
     if max_proba <= 0:
         assert tot_neighbours > num_edges, \
             "Scale is too small: there are not enough close neighbours to " +\
@@ -987,36 +1131,52 @@ def _distance_rule(source_ids, target_ids, density=None, edges=None,
     ia_edges = None
     num_ecurrent = 0
 
+    rng = nngt._rng
+
+    # specialize the distance rule once for all tests; the Gaussian rule
+    # only needs the squared distances, so no square root is computed for
+    # the tests
+    squared = (rule == 'gaussian')
+
+    kernel = _dist_kernel(rule, scale, max_proba if max_proba > 0 else 1.,
+                          squared=squared)
+
+    # store all candidate targets contiguously (CSR-like layout) so that
+    # all sources are processed at once
+    flat_targets = np.concatenate(list_targets)
+    offsets = np.cumsum(num_neighbours) - num_neighbours
+
     if max_proba <= 0:
         ia_edges = np.full((num_edges, 2), -1, dtype=int)
+
+        has_neighbours = num_neighbours > 0
+
         while num_ecurrent < num_edges:
-            trials = []
-            for tgt_list in list_targets:
-                trials.append(max(
-                    int(len(tgt_list)*(num_edges - num_ecurrent)*neigh_norm),
-                    1))
-            edges_tmp = [[], []]
-            dist = []
-            dist_tmp = []
-            total_trials = int(np.sum(trials))
-            local_targets = []
-            local_sources = []
-            current_pos = 0
-            for s, tgts, num_try in zip(source_ids, list_targets, trials):
-                if len(tgts):
-                    t = np.random.randint(0, len(tgts), num_try)
-                    local_targets.extend(tgts[t])
-                    local_sources.extend((s for _ in range(num_try)))
-            local_targets = np.array(local_targets, dtype=int)
-            local_sources = np.array(local_sources, dtype=int)
-            test = dist_rule(rule, scale, positions[:, local_sources],
-                             positions[:, local_targets], dist=dist_tmp)
-            test = np.greater(test, np.random.uniform(size=len(test)))
-            edges_tmp[0].extend(local_sources[test])
-            edges_tmp[1].extend(local_targets[test])
-            dist = np.array(dist_tmp)[test]
-
-            edges_tmp = np.array(edges_tmp).T
+            remaining = num_edges - num_ecurrent
+            trials = np.maximum(
+                (num_neighbours*remaining*neigh_norm).astype(int), 1)
+            trials[~has_neighbours] = 0
+
+            local_sources = np.repeat(source_ids, trials)
+            local_targets = flat_targets[
+                np.repeat(offsets, trials)
+                + rng.integers(0, np.repeat(num_neighbours, trials))]
+
+            # test the candidates by chunks to bound memory usage
+            edges_tmp = [np.empty((0, 2), dtype=int)]
+            dist_buf = np.empty(min(CHUNK, len(local_targets)),
+                                dtype=np.float32)
+
+            for start in range(0, len(local_targets), CHUNK):
+                ls_c = local_sources[start:start + CHUNK]
+                lt_c = local_targets[start:start + CHUNK]
+                dist_c = _pair_dist(pos_x, pos_y, ls_c, lt_c, squared,
+                                    out=dist_buf[:len(lt_c)])
+                test = np.greater(kernel(dist_c), rng.random(len(dist_c)))
+
+                edges_tmp.append(np.column_stack((ls_c[test], lt_c[test])))
+
+            edges_tmp = np.concatenate(edges_tmp)
 
             # assess the current number of edges
             # if we're at the end, we'll make too many edges, so we keep only
@@ -1025,32 +1185,70 @@ def _distance_rule(source_ids, target_ids, density=None, edges=None,
             if num_desired < len(edges_tmp):
                 chosen = {}
                 while len(chosen) != num_desired:
-                    idx = np.random.randint(
+                    idx = rng.integers(
                         0, len(edges_tmp), num_desired - len(chosen))
                     for i in idx:
                         chosen[i] = None
                 idx = list(chosen.keys())
                 edges_tmp = edges_tmp[idx]
-                dist = dist[idx]
 
-            ia_edges, num_ecurrent = _filter(
-                ia_edges, edges_tmp, num_ecurrent, edges_hash, b_one_pop,
-                multigraph, directed=directed, recip_hash=recip_hash,
-                distance=distance, dist_tmp=dist)
+            ia_edges, num_ecurrent, edges_keys = _filter_packed(
+                ia_edges, edges_tmp, num_ecurrent, edges_keys, max_id,
+                b_one_pop, multigraph, directed=directed)
     else:
-        sources, targets = [], []
-        for i, s in enumerate(source_ids):
-            local_tgts = np.array(list_targets[i], dtype=int)
-            if len(local_tgts):
-                dist_tmp = []
-                test = max_proba_dist_rule(
-                    rule, scale, max_proba, positions[:, s],
-                    positions[:, local_tgts], dist=dist_tmp)
-                test = np.greater(test, np.random.uniform(size=len(test)))
-                added = np.sum(test)
-                sources.extend((s for _ in range(added)))
-                targets.extend(local_tgts[test])
-                distance.extend(np.array(dist_tmp)[test])
-        ia_edges = np.array([sources, targets]).T
+        # test every (source, candidate target) pair exactly once: each
+        # chunk writes its results in its own slice of preallocated arrays
+        # and the acceptance mask is applied at the end
+        flat_sources = np.repeat(source_ids, num_neighbours)
+
+        accept = np.empty(tot_neighbours, dtype=bool)
+        dist_buf = np.empty(tot_neighbours, dtype=np.float32)
+
+        for start in range(0, tot_neighbours, CHUNK):
+            ls_c = flat_sources[start:start + CHUNK]
+            lt_c = flat_targets[start:start + CHUNK]
+            dist_c = _pair_dist(pos_x, pos_y, ls_c, lt_c, squared,
+                                out=dist_buf[start:start + CHUNK])
+            accept[start:start + CHUNK] = np.greater(
+                kernel(dist_c), rng.random(len(dist_c)))
+
+        ia_edges = np.column_stack((flat_sources[accept],
+                                    flat_targets[accept]))
+
+    distance.extend(_pair_dist(
+        np.asarray(positions[0], dtype=float),
+        np.asarray(positions[1], dtype=float), ia_edges[:, 0], ia_edges[:, 1]))
 
     return ia_edges
+
+
+def _pair_dist(pos_x, pos_y, sources, targets, squared=False, out=None):
+    ''' Distances (or squared distances) between sources and targets '''
+    dx = pos_x[targets] - pos_x[sources]
+    dy = pos_y[targets] - pos_y[sources]
+
+    if squared:
+        dist = np.multiply(dx, dx, out=out)
+        dist += np.square(dy, out=dy)
+        return dist
+
+    return np.hypot(dx, dy, out=out)
+
+
+def _positions_in(values, arr):
+    '''
+    Return the positions of `values` in `arr` and a boolean array telling
+    whether each value was found (position is meaningless otherwise).
+    '''
+    values = np.asarray(values)
+
+    if len(arr) == 0:
+        return (np.zeros(len(values), dtype=int),
+                np.zeros(len(values), dtype=bool))
+
+    sorter = np.argsort(arr)
+    pos = np.searchsorted(arr, values, sorter=sorter)
+    pos[pos == len(arr)] = 0
+    pos = sorter[pos]
+
+    return pos, arr[pos] == values
@@ -82,7 +82,8 @@ def connect_nodes(network, sources, targets, graph_model, density=None,
     nodes which have their property sets are the `sources`.
     '''
     if network.is_spatial() and 'positions' not in kwargs:
-        kwargs['positions'] = network.get_positions().astype(np.float32).T
+        kwargs['positions'] = np.array(
+            network.get_positions().T, dtype=float)
     if network.is_spatial() and 'shape' not in kwargs:
         kwargs['shape'] = network.shape
 
@@ -180,29 +181,35 @@ def connect_neural_types(network, source_type, target_type, graph_model,
     '''
     assert network.is_network(), "This function requires a Network object."
 
-    elist, source_ids, target_ids = None, [], []
+    elist, source_groups, target_groups = None, [], []
 
     if network.is_spatial() and 'positions' not in kwargs:
-        kwargs['positions'] = network.get_positions().astype(np.float32).T
+        kwargs['positions'] = np.array(
+            network.get_positions().T, dtype=float)
 
     if network.is_spatial() and 'shape' not in kwargs:
         kwargs['shape'] = network.shape
 
-    if not nonstring_container(source_type):
-        source_type = [source_type]
+    # sets for constant-time membership tests in the loop over groups
+    if nonstring_container(source_type):
+        source_type = frozenset(source_type)
+    else:
+        source_type = frozenset((source_type,))
 
-    if not nonstring_container(target_type):
-        target_type = [target_type]
+    if nonstring_container(target_type):
+        target_type = frozenset(target_type)
+    else:
+        target_type = frozenset((target_type,))
 
     for group in network._population.values():
         if group.neuron_type in source_type:
-            source_ids.extend(group.ids)
+            source_groups.append(group)
 
         if group.neuron_type in target_type:
-            target_ids.extend(group.ids)
+            target_groups.append(group)
 
-    source_ids = np.array(source_ids, dtype=np.uint)
-    target_ids = np.array(target_ids, dtype=np.uint)
+    source_ids = _group_ids(source_groups)
+    target_ids = _group_ids(target_groups)
 
     elist = connect_nodes(
         network, source_ids, target_ids, graph_model, density=density,
@@ -264,11 +271,10 @@ def connect_groups(network, source_groups, target_groups, graph_model,
     specific degree (e.g. :func:`~nngt.generation.gaussian_degree`), the
     groups which have their property sets are the `source_groups`.
     '''
-    source_ids, target_ids = [], []
-
     if network.is_spatial():
         if 'positions' not in kwargs:
-            kwargs['positions'] = network.get_positions().astype(np.float32).T
+            kwargs['positions'] = np.array(
+                network.get_positions().T, dtype=float)
         if 'shape' not in kwargs:
             kwargs['shape'] = network.shape
 
@@ -277,24 +283,13 @@ def connect_groups(network, source_groups, target_groups, graph_model,
     if isinstance(target_groups, str) or not is_iterable(target_groups):
         target_groups = [target_groups]
 
-    for s in source_groups:
-        if isinstance(s, nngt.Structure):
-            source_ids.extend(s.ids)
-        elif isinstance(s, nngt.Group):
-            source_ids.extend(s.ids)
-        else:
-            source_ids.extend(network.structure[s].ids)
-
-    for t in target_groups:
-        if isinstance(t, nngt.Structure):
-            target_ids.extend(t.ids)
-        elif isinstance(t, nngt.Group):
-            target_ids.extend(t.ids)
-        else:
-            target_ids.extend(network.structure[t].ids)
+    source_ids = _group_ids(
+        [s if isinstance(s, (nngt.Structure, nngt.Group))
+         else network.structure[s] for s in source_groups])
 
-    source_ids = np.array(source_ids, dtype=np.uint)
-    target_ids = np.array(target_ids, dtype=np.uint)
+    target_ids = _group_ids(
+        [t if isinstance(t, (nngt.Structure, nngt.Group))
+         else network.structure[t] for t in target_groups])
 
     elist = connect_nodes(
         network, source_ids, target_ids, graph_model, density=density,
@@ -307,3 +302,24 @@ def connect_groups(network, source_groups, target_groups, graph_model,
         network._graph_type += "_neural_group_connect"
 
     return elist
+
+
+# ----- #
+# Tools #
+# ----- #
+
+def _group_ids(groups):
+    '''
+    Return the ids of all nodes in `groups` as a single array, in order.
+    '''
+    lst_ids = [g.ids for g in groups]
+
+    ids = np.empty(sum(len(l) for l in lst_ids), dtype=np.uint)
+
+    offset = 0
+
+    for l in lst_ids:
+        ids[offset:offset + len(l)] = l
+        offset += len(l)
+
+    return ids
@@ -6,6 +6,8 @@
 """ Connectivity generators for nngt.Graph """
 
 from copy import deepcopy
+import importlib
+import importlib.util
 import logging
 
 import numpy as np
@@ -43,48 +45,111 @@ from .connect_algorithms import *
 
 using_mt_algorithms = False
 
-if nngt.get_config("multithreading"):
+# names exported by the cconnect module
+_cconnect_names = (
+    "_all_to_all", "_distance_rule", "_fixed_degree", "_from_degree_list",
+    "_gaussian_degree",
+)
+
+# cconnect generators, filled on first use when the module must be compiled
+_cconnect_funcs = {}
+
+
+def _load_cconnect():
+    '''
+    Compile and import the multithreaded algorithms on-the-run, falling back
+    to the non-multithreaded ones if this fails.
+    This is only done on the first call to a generator so that importing
+    NNGT does not require Cython; until then, `using_mt_algorithms` is False
+    while the "multithreading" config entry keeps the requested value, and is
+    only reset to False if compilation fails.
+    '''
+    global using_mt_algorithms
+
+    if _cconnect_funcs:
+        return _cconnect_funcs
+
     logger = logging.getLogger(__name__)
+
     try:
-        from .cconnect import *
+        import cython
+        import pyximport
+
+        try:
+            from mpi4py import MPI
+            comm = MPI.COMM_WORLD
+            comm.bcast(pyximport.install(language_level=3))
+        except:
+            if nngt.get_config("mpi"):
+                raise RuntimeError("Cannot safely compile with MPI.")
+
+            pyximport.install(language_level=3)
+
+        # wait for compilation to finish
+        nngt.lib.mpi_barrier()
+
+        if on_master_process():
+            importlib.import_module(".cconnect", __package__)
+
+        nngt.lib.mpi_barrier()
+
+        module = importlib.import_module(".cconnect", __package__)
+
+        _cconnect_funcs.update(
+            {name: getattr(module, name) for name in _cconnect_names})
+
         using_mt_algorithms = True
+
+        nngt._config['multithreading'] = True
+
         _log_message(logger, "DEBUG",
-                     "Using multithreaded algorithms compiled on install.")
-        nngt.set_config('multithreading', True, silent=True)
+                     "Compiled multithreaded algorithms on-the-run.")
     except Exception as e:
-        try:
-            import cython
-            import pyximport
+        _log_message(
+            logger, "WARNING", str(e) + "\n\t"
+            "Cython import failed, using non-multithreaded algorithms.")
+
+        module = importlib.import_module(".connect_algorithms", __package__)
+
+        _cconnect_funcs.update(
+            {name: getattr(module, name) for name in _cconnect_names})
 
-            try:
-                from mpi4py import MPI
-                comm = MPI.COMM_WORLD
-                comm.bcast(pyximport.install(language_level=3))
-            except:
-                if nngt.get_config("mpi"):
-                    raise RuntimeError("Cannot safely compile with MPI.")
+        using_mt_algorithms = False
 
-                pyximport.install(language_level=3)
+        nngt._config['multithreading'] = False
 
-            # wait for compilation to finish
-            nngt.lib.mpi_barrier()
+    return _cconnect_funcs
 
-            if on_master_process():
-                from .cconnect import *
 
-            nngt.lib.mpi_barrier()
+def _lazy_cconnect(name):
+    ''' Generator loading the multithreaded algorithms on first call '''
+    def generator(*args, **kwargs):
+        return _load_cconnect()[name](*args, **kwargs)
 
-            from .cconnect import *
+    generator.__name__ = name
 
-            using_mt_algorithms = True
+    return generator
 
-            _log_message(logger, "DEBUG", str(e) + "\n\tCompiled "
-                         "multithreaded algorithms on-the-run.")
 
-            nngt.set_config('multithreading', True, silent=True)
-        except Exception as e2:
+if nngt.get_config("multithreading"):
+    logger = logging.getLogger(__name__)
+    try:
+        from .cconnect import *
+        using_mt_algorithms = True
+        _log_message(logger, "DEBUG",
+                     "Using multithreaded algorithms compiled on install.")
+        nngt.set_config('multithreading', True, silent=True)
+    except Exception as e:
+        if importlib.util.find_spec("pyximport") is not None:
+            # not compiled on install: defer compilation until first use
+            _log_message(logger, "DEBUG", str(e) + "\n\tMultithreaded "
+                         "algorithms will be compiled on first use.")
+
+            for _name in _cconnect_names:
+                globals()[_name] = _lazy_cconnect(_name)
+        else:
             _log_message(
-                logger, "WARNING", str(e) + "\n\t" + str(e2) + "\n\t"
+                logger, "WARNING", str(e) + "\n\t"
                 "Cython import failed, using non-multithreaded algorithms.")
             nngt._config['multithreading'] = False
 
@@ -477,7 +542,7 @@ def erdos_renyi(density=None, nodes=0, edges=None, avg_deg=None,
     ia_edges = None
 
     if nodes > 1:
-        ids = range(nodes)
+        ids = np.arange(nodes, dtype=np.uint)
         ia_edges = _erdos_renyi(ids, ids, density, edges, avg_deg, reciprocity,
                                 directed, multigraph)
         graph_er.new_edges(ia_edges, check_duplicates=False,
@@ -562,7 +627,7 @@ def random_scale_free(in_exp, out_exp, nodes=0, density=None, edges=None,
 
     # add edges
     if nodes > 1:
-        ids = range(nodes)
+        ids = np.arange(nodes, dtype=np.uint)
         ia_edges = _random_scale_free(ids, ids, in_exp, out_exp, density,
                           edges, avg_deg, reciprocity, directed, multigraph)
         graph_rsf.new_edges(ia_edges, check_duplicates=False,
@@ -667,7 +732,7 @@ def price_scale_free(m, c=None, gamma=1, nodes=0, reciprocity=0, weighted=True,
 
     # add edges
     if nodes > 1:
-        ids = range(nodes)
+        ids = np.arange(nodes, dtype=np.uint)
         edges = _price_scale_free(ids, m, c, gamma, reciprocity, directed,
                                      multigraph)
 
@@ -759,7 +824,7 @@ def circular(coord_nb, reciprocity=1., reciprocity_choice="random", nodes=0,
 
     # add edges
     if nodes > 1:
-        ids   = range(nodes)
+        ids   = np.arange(nodes, dtype=np.uint)
         edges = _circular(ids, ids, coord_nb, reciprocity, directed,
                           reciprocity_choice=reciprocity_choice)
 
@@ -856,7 +921,7 @@ def newman_watts(coord_nb, proba_shortcut=None, reciprocity_circular=1.,
 
     # add edges
     if nodes > 1:
-        ids = range(nodes)
+        ids = np.arange(nodes, dtype=np.uint)
 
         ia_edges = _newman_watts(
             ids, ids, coord_nb, proba_shortcut, reciprocity_circular,
@@ -952,7 +1017,7 @@ def watts_strogatz(coord_nb, proba_shortcut=None, reciprocity_circular=1.,
 
     # add edges
     if nodes > 1:
-        ids = range(nodes)
+        ids = np.arange(nodes, dtype=np.uint)
 
         ia_edges = _watts_strogatz(
             ids, ids, coord_nb, proba_shortcut, reciprocity_circular,
@@ -1525,24 +1590,31 @@ def distance_rule(scale, rule="exp", shape=None, neuron_density=1000.,
         graph_dr.clear_all_edges()
     else:
         nodes = population.size if population is not None else nodes
+    # a spatial `from_graph` keeps its shape and positions unless new ones
+    # are provided
+    keep_spatial = (graph_dr is not None and graph_dr.is_spatial()
+                    and shape is None and positions is None)
     # check shape
-    if shape is None:
+    if keep_spatial:
+        shape = graph_dr.shape
+    elif shape is None:
         h = w = np.sqrt(float(nodes) / neuron_density)
         shape = nngt.geometry.Shape.rectangle(h, w)
     if graph_dr is None:
         graph_dr = nngt.SpatialGraph(
             name=name, nodes=nodes, directed=directed, shape=shape,
             positions=positions, **kwargs)
-    else:
-        Graph.make_spatial(graph_dr, shape, positions=positions)
-    positions = np.array(graph_dr.get_positions().T, dtype=np.float32)
+    elif not keep_spatial:
+        nngt.Graph.make_spatial(graph_dr, shape, positions=positions)
+    positions = np.array(graph_dr.get_positions().T, dtype=float)
     # set options (graph has already been made spatial)
     _set_options(graph_dr, population, None, None)
     # add edges
     ia_edges = None
     conversion_factor = conversion_magnitude(shape.unit, unit)
     if unit != shape.unit:
-        positions = np.multiply(conversion_factor, positions, dtype=np.float32)
+        # positions is already a private copy, scale it in place
+        positions *= conversion_factor
     if nodes > 1:
         ids = np.arange(0, nodes, dtype=np.uint)
         ia_edges = _distance_rule(
@@ -1599,9 +1671,18 @@ def generate(di_instructions, **kwargs):
     :mod:`~nngt.generation`
     '''
     graph_type = di_instructions["graph_type"]
-    instructions = deepcopy(di_instructions)
 
-    del instructions["graph_type"]
+    # shallow copy for the scalar arguments, but the population and shape
+    # are bound to the generated graph so each call must get its own
+    instructions = {
+        k: v for k, v in di_instructions.items() if k != "graph_type"
+    }
+
+    if instructions.get("population") is not None:
+        instructions["population"] = deepcopy(instructions["population"])
+
+    if instructions.get("shape") is not None:
+        instructions["shape"] = instructions["shape"].copy()
 
     instructions.update(kwargs)
 
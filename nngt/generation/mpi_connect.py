@@ -8,8 +8,8 @@
 import warnings
 import numpy as np
 import scipy.sparse as ssp
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
-from numpy.random import randint
 
 from mpi4py import MPI
 
@@ -44,6 +44,8 @@ def _from_degree_list(source_ids, target_ids, degrees, degree_type="in",
     # mpi-related stuff
     comm, size, rank = _mpi_and_random_init()
 
+    rng = nngt._rng
+
     # use only local sources and degrees unless already_local=True
     if not kwargs.get("already_local", False):
         source_ids = np.array(source_ids, dtype=int)[rank::size]
@@ -90,8 +92,8 @@ def _from_degree_list(source_ids, target_ids, degrees, degree_type="in",
         ia_edges[num_etotal:num_etotal + degree_i, idx] = v
 
         while len(variables_i) != degree_i:
-            variables_i.extend(np.random.choice(var_tmp, degree_i-ecurrent,
-                                                replace=multigraph))
+            variables_i.extend(rng.choice(var_tmp, degree_i-ecurrent,
+                                          replace=multigraph))
 
             if not multigraph:
                 variables_i = list(set(variables_i))
@@ -166,7 +168,7 @@ def _gaussian_degree(source_ids, target_ids, avg=-1, std=-1, degree_type="in",
 
     # compute the local number of edges
     lst_deg = np.around(
-        np.maximum(np.random.normal(avg, std, num_source), 0.)).astype(int)
+        np.maximum(nngt._rng.normal(avg, std, num_source), 0.)).astype(int)
 
     # !IMPORTANT! use `already_local` to tell _from_degree_list that only
     # local sources and degrees have been sent
@@ -185,13 +187,14 @@ def _distance_rule(source_ids, target_ids, density=-1, edges=-1, avg_deg=-1,
     '''
     assert max_proba <= 0, "MPI distance_rule cannot use `max_proba` yet."
 
-    distance     = [] if distance is None else distance
-    distance_tmp = []
-    edges_hash   = set()
+    distance   = [] if distance is None else distance
+    edges_keys = np.empty(0, dtype=np.int64)
 
     # mpi-related stuff
     comm, size, rank = _mpi_and_random_init()
 
+    rng = nngt._rng
+
     # compute the required values
     source_ids = np.array(source_ids).astype(int)
     target_ids = np.array(target_ids).astype(int)
@@ -203,26 +206,41 @@ def _distance_rule(source_ids, target_ids, density=-1, edges=-1, avg_deg=-1,
         source_ids, target_ids, num_edges, directed, multigraph)
     num_neurons = len(set(np.concatenate((source_ids, target_ids))))
 
+    # upper bound on node ids, used to pack edges into int64 keys
+    max_id = int(max(source_ids.max(), target_ids.max())) + 1
+
     # for each node, check the neighbours that are in an area where
     # connections can be made: ± scale for lin, ± 10*scale for exp.
     # Get the sources and associated targets for each MPI process
     sources = []
     targets = []
     lim = scale if rule == 'lin' else 10*scale
-    for s in source_ids[rank::size]:
-        keep  = (np.abs(positions[0, target_ids] - positions[0, s]) < lim)
-        keep *= (np.abs(positions[1, target_ids] - positions[1, s]) < lim)
+
+    tree = cKDTree(positions[:, target_ids].T)
+
+    local_sources = source_ids[rank::size]
+
+    neighbours = tree.query_ball_point(
+        positions[:, local_sources].T, r=lim, return_sorted=True)
+
+    for s, nn in zip(local_sources, neighbours):
+        tgts = target_ids[np.asarray(nn, dtype=int)]
         if b_one_pop:
-            keep[s] = 0
+            tgts = tgts[tgts != s]
         sources.append(s)
-        targets.append(target_ids[keep])
+        targets.append(tgts)
 
     # the number of trials should be done depending on total number of
     # neighbours available, so we compute this number
-    local_neighbours = 0
+    num_neighbours   = np.array([len(tgts) for tgts in targets], dtype=int)
+    local_neighbours = int(num_neighbours.sum())
+    has_neighbours   = num_neighbours > 0
 
-    for tgt_list in targets:
-        local_neighbours += len(tgt_list)
+    # store all candidate targets contiguously so that they can be drawn
+    # for all sources at once
+    flat_targets = np.concatenate(targets) if targets \
+                   else np.empty(0, dtype=int)
+    offsets = np.cumsum(num_neighbours) - num_neighbours
 
     tot_neighbours = comm.gather(local_neighbours, root=0)
     if rank == 0:
@@ -239,33 +257,30 @@ def _distance_rule(source_ids, target_ids, density=-1, edges=-1, avg_deg=-1,
 
     # try to create edges until num_edges is attained
     if rank == 0:
-        ia_edges = np.zeros((num_edges, 2), dtype=int)
+        ia_edges     = np.zeros((num_edges, 2), dtype=int)
+        distance_tmp = np.empty(num_edges)
     else:
-        ia_edges = None
+        ia_edges     = None
+        distance_tmp = None
     num_ecurrent = 0
 
     while num_ecurrent < num_edges:
-        trials = []
-        for tgt_list in targets:
-            trials.append(max(
-                int(len(tgt_list)*(num_edges - num_ecurrent)*neigh_norm), 1))
+        trials = np.maximum(
+            (num_neighbours*(num_edges - num_ecurrent)*neigh_norm).astype(int),
+            1)
+        trials[~has_neighbours] = 0
         # try to create edges
-        edges_tmp = [[], []]
-        dist_local = []
-        total_trials = int(np.sum(trials))
+        total_trials = int(trials.sum())
+        dist_local = np.empty(total_trials)
         local_sources = np.repeat(sources, trials)
-        local_targets = np.zeros(total_trials, dtype=int)
-        current_pos = 0
-        for tgts, num_try in zip(targets, trials):
-            t = np.random.randint(0, len(tgts), num_try)
-            local_targets[current_pos:current_pos + num_try] = tgts[t]
-            current_pos += num_try
+        local_targets = flat_targets[
+            np.repeat(offsets, trials)
+            + rng.integers(0, np.repeat(num_neighbours, trials))]
         test = dist_rule(rule, scale, positions[:, local_sources],
-                         positions[:, local_targets], dist=dist_local)
-        test = np.greater(test, np.random.uniform(size=total_trials))
-        edges_tmp[0].extend(local_sources[test])
-        edges_tmp[1].extend(local_targets[test])
-        dist_local = np.array(dist_local)[test]
+                         positions[:, local_targets], out=dist_local)
+        test = np.greater(test, rng.random(total_trials))
+        edges_tmp = [local_sources[test], local_targets[test]]
+        dist_local = dist_local[test]
 
         comm.Barrier()
 
@@ -283,14 +298,15 @@ def _distance_rule(source_ids, target_ids, density=-1, edges=-1, avg_deg=-1,
             num_tmp     = len(edges_tmp)
 
             if num_desired < num_tmp:
-                chosen = np.random.choice(num_tmp, num_desired,
-                                          replace=multigraph)
+                chosen = rng.choice(num_tmp, num_desired,
+                                    replace=multigraph)
                 edges_tmp = edges_tmp[chosen]
-                dist_local = np.array(dist_local)[chosen]
+                dist_local = dist_local[chosen]
 
-            ia_edges, num_ecurrent = _filter(
-                ia_edges, edges_tmp, num_ecurrent, edges_hash, b_one_pop,
-                multigraph, distance=distance_tmp, dist_tmp=dist_local)
+            ia_edges, num_ecurrent, edges_keys = _filter_packed(
+                ia_edges, edges_tmp, num_ecurrent, edges_keys, max_id,
+                b_one_pop, multigraph, directed=directed,
+                distance=distance_tmp, dist_tmp=dist_local)
 
         num_ecurrent = comm.bcast(num_ecurrent, root=0)
 
@@ -367,6 +383,7 @@ def _mpi_and_random_init():
 
     seed  = seeds[rank]
     np.random.seed(seed)
+    nngt._rng = np.random.default_rng(seed)
 
     nngt._seeded_local = True
     nngt._used_local   = True
@@ -388,3 +405,4 @@ def _finalize_random(rank):
     new_seed = comm.bcast(new_seed, root=0)
 
     np.random.seed(new_seed)
+    nngt._rng = np.random.default_rng(new_seed)
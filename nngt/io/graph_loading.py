@@ -6,7 +6,7 @@
 """ Loading functions """
 
 import ast
-import codecs
+import base64
 import logging
 import pickle
 import types
@@ -17,7 +17,7 @@ import nngt
 from nngt.lib import InvalidArgument
 from nngt.lib.logger import _log_message
 from ..geometry import Shape, _shapely_support
-from .io_helpers import _get_format
+from .io_helpers import _get_format, _open_file
 from .loading_helpers import *
 
 
@@ -58,7 +58,9 @@ def load_from_file(filename, fmt="auto", separator=" ", secondary=";",
     Parameters
     ----------
     filename: str
-        The path to the file.
+        The path to the file. Text formats can be compressed with gzip, bzip2
+        or xz, which is detected from a final '.gz', '.bz2' or '.xz'
+        extension.
     fmt : str, optional (default: "neighbour")
         The format used to save the graph. Supported formats are: "neighbour"
         (neighbour list, default if format cannot be deduced automatically),
@@ -68,7 +70,11 @@ def load_from_file(filename, fmt="auto", separator=" ", secondary=";",
         (graphml format, default if `filename` ends with '.graphml' or '.xml'),
         "dot" (dot format, default if `filename` ends with '.dot'), "gt" (only
         when using `graph_tool`<http://graph-tool.skewed.de/>_ as library,
-        detected if `filename` ends with '.gt').
+        detected if `filename` ends with '.gt'), "csr" (binary NumPy archive
+        containing the CSR structure of the graph and its attributes, detected
+        if `filename` ends with '.npz'; the arrays are only unpickled if
+        there are "object" attributes, but a structure or population is
+        always unpickled, whatever the format).
     separator : str, optional (default " ")
         separator used to separate inputs in the case of custom formats (namely
         "neighbour" and "edge_list")
@@ -136,7 +142,11 @@ def _load_from_file(filename, fmt="auto", separator=" ", secondary=";",
         (graphml format, default if `filename` ends with '.graphml' or '.xml'),
         "dot" (dot format, default if `filename` ends with '.dot'), "gt" (only
         when using `graph_tool <http://graph-tool.skewed.de/>`_ as library,
-        detected if `filename` ends with '.gt').
+        detected if `filename` ends with '.gt'), "csr" (binary NumPy archive
+        containing the CSR structure of the graph and its attributes, detected
+        if `filename` ends with '.npz'; the arrays are only unpickled if
+        there are "object" attributes, but a structure or population is
+        always unpickled, whatever the format).
     separator : str, optional (default " ")
         separator used to separate inputs in the case of custom formats (namely
         "neighbour" and "edge_list")
@@ -190,41 +200,23 @@ def _load_from_file(filename, fmt="auto", separator=" ", secondary=";",
         raise NotImplementedError("This function is not ready for MPI yet.")
 
     # load
-    lst_lines, struct, shape, positions = None, None, None, None
+    struct, shape, positions = None, None, None
     fmt = _get_format(fmt, filename)
 
-    if fmt not in di_get_edges:
+    if fmt not in di_get_edges and fmt != "csr":
         raise ValueError("Unsupported format: '{}'".format(fmt))
 
-    with open(filename, "r") as filegraph:
-        lst_lines = _process_file(filegraph, fmt, separator)
-
-    # notifier lines
-    di_notif = _get_notif(filename, lst_lines, notifier, attributes, fmt=fmt,
-                          atypes=attributes_types)
-
-    # get nodes attributes
-    nattr_convertor = _gen_convert(di_notif["node_attributes"],
-                                   di_notif["node_attr_types"],
-                                   attributes_types=attributes_types)
-    di_nattributes = _get_node_attr(di_notif, separator, fmt=fmt,
-                                    lines=lst_lines, convertor=nattr_convertor)
-
-    # make edges and attributes
-    eattributes     = di_notif["edge_attributes"]
-    di_eattributes  = {name: [] for name in eattributes}
-    eattr_convertor = _gen_convert(di_notif["edge_attributes"],
-                                   di_notif["edge_attr_types"],
-                                   attributes_types=attributes_types)
-
-    # process file
-    edges = di_get_edges[fmt](
-        lst_lines, eattributes, ignore, notifier, separator, secondary,
-        di_attributes=di_eattributes, convertor=eattr_convertor,
-        di_notif=di_notif)
+    if fmt == "csr":
+        di_notif, edges, di_nattributes, di_eattributes, positions = \
+            _load_csr(filename)
+    else:
+        di_notif, edges, di_nattributes, di_eattributes = _load_text(
+            filename, fmt, separator, secondary, attributes,
+            attributes_types, notifier, ignore)
 
     if cleanup:
-        edges = np.array(edges) - np.min(edges)
+        edges = np.asarray(edges, dtype=np.int64)
+        edges -= edges.min()
 
     # add missing size information if necessary
     if "size" not in di_notif:
@@ -239,28 +231,25 @@ def _load_from_file(filename, fmt="auto", separator=" ", secondary=";",
                 di_notif['shape'], min_x=min_x, max_x=max_x, unit=unit)
             # load areas
             try:
-                def_areas      = ast.literal_eval(di_notif['default_areas'])
-                def_areas_prop = ast.literal_eval(
-                    di_notif['default_areas_prop'])
+                # parse default and non-default areas, then add them at once
+                areas = _as_literal(di_notif['default_areas'])
+                props = _as_literal(di_notif['default_areas_prop'])
+
+                ndef_areas = _as_literal(di_notif['non_default_areas'])
+
+                areas.update(ndef_areas)
+                props.update(_as_literal(di_notif['non_default_areas_prop']))
 
-                for k in def_areas:
-                    p = {key: float(v) for key, v in def_areas_prop[k].items()}
-                    if "default_area" in k:
+                for k, wkt in areas.items():
+                    p = {key: float(v) for key, v in props[k].items()}
+
+                    if "default_area" in k and k not in ndef_areas:
                         shape._areas["default_area"]._prop.update(p)
                         shape._areas["default_area"].height = p["height"]
                     else:
-                        a = Shape.from_wkt(def_areas[k], unit=unit)
+                        a = Shape.from_wkt(wkt, unit=unit)
                         shape.add_area(a, height=p["height"], name=k,
                                        properties=p)
-
-                ndef_areas      = ast.literal_eval(
-                                      di_notif['non_default_areas'])
-                ndef_areas_prop = ast.literal_eval(
-                                      di_notif['non_default_areas_prop'])
-                for i in ndef_areas:
-                    p = {k: float(v) for k, v in ndef_areas_prop[i].items()}
-                    a = Shape.from_wkt(ndef_areas[i], unit=unit)
-                    shape.add_area(a, height=p["height"], name=i, properties=p)
             except KeyError:
                 # backup compatibility with older versions
                 pass
@@ -269,28 +258,74 @@ def _load_from_file(filename, fmt="auto", separator=" ", secondary=";",
                          'A Shape object was present in the file but could '
                          'not be loaded because Shapely is not installed.')
 
-    # check whether a structure is present
+    # check whether a structure is present (it is always pickled, including
+    # in binary files, so only load files with a structure from trusted
+    # sources)
     if 'structure' in di_notif:
-        str_enc = di_notif['structure'].replace('~', '\n').encode()
-        str_dec = codecs.decode(str_enc, "base64")
+        # files written by older versions use '~' instead of line ends,
+        # which b64decode discards like any non-base64 character
+        str_dec = base64.b64decode(di_notif['structure'])
         try:
             struct = pickle.loads(str_dec)
         except UnicodeError:
             struct = pickle.loads(str_dec, encoding="latin1")
 
     if 'x' in di_notif:
-        x = np.fromstring(di_notif['x'], sep=separator)
-        y = np.fromstring(di_notif['y'], sep=separator)
-        if 'z' in di_notif:
-            z = np.fromstring(di_notif['z'], sep=separator)
-            positions = np.array((x, y, z)).T
-        else:
-            positions = np.array((x, y)).T
+        # fill the (N, d) array column by column (no transposed copy)
+        axes = ('x', 'y', 'z') if 'z' in di_notif else ('x', 'y')
+        x    = np.fromstring(di_notif['x'], sep=separator)
+
+        positions = np.empty((len(x), len(axes)))
+        positions[:, 0] = x
+
+        for i, ax in enumerate(axes[1:], 1):
+            positions[:, i] = np.fromstring(di_notif[ax], sep=separator)
 
     return (di_notif, edges, di_nattributes, di_eattributes, struct, shape,
             positions)
 
 
+def _load_text(filename, fmt, separator, secondary, attributes,
+               attributes_types, notifier, ignore):
+    ''' Parse the notifiers, attributes and edges of a text file '''
+    with _open_file(filename) as filegraph:
+        lst_lines = _process_file(filegraph, fmt, separator)
+
+    # notifier lines
+    di_notif = _get_notif(filename, lst_lines, notifier, attributes, fmt=fmt,
+                          atypes=attributes_types)
+
+    # get nodes attributes
+    nattr_convertor = _gen_convert(di_notif["node_attributes"],
+                                   di_notif["node_attr_types"],
+                                   attributes_types=attributes_types)
+    di_nattributes = _get_node_attr(di_notif, separator, fmt=fmt,
+                                    lines=lst_lines, convertor=nattr_convertor)
+
+    # make edges and attributes
+    eattributes     = di_notif["edge_attributes"]
+    di_eattributes  = {name: [] for name in eattributes}
+    eattr_convertor = _gen_convert(di_notif["edge_attributes"],
+                                   di_notif["edge_attr_types"],
+                                   attributes_types=attributes_types)
+
+    # process file
+    edges = di_get_edges[fmt](
+        lst_lines, eattributes, ignore, notifier, separator, secondary,
+        di_attributes=di_eattributes, convertor=eattr_convertor,
+        di_notif=di_notif)
+
+    return di_notif, edges, di_nattributes, di_eattributes
+
+
+def _as_literal(value):
+    '''
+    Text files store dicts as strings, binary files store them as is (a copy
+    is returned so that the notifiers are not modified)
+    '''
+    return ast.literal_eval(value) if isinstance(value, str) else dict(value)
+
+
 def _library_load(filename, fmt):
     ''' Load the file using the library functions '''
     if nngt.get_config("backend") == "networkx":
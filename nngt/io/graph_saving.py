@@ -5,14 +5,15 @@
 
 """ IO tools for NNGT """
 
-import codecs
+import base64
+import copyreg
+import io
+import json
 import logging
 import pickle
 import sys
 import weakref
 
-from collections import defaultdict
-
 import numpy as np
 import scipy.sparse as ssp
 
@@ -21,10 +22,10 @@ from nngt.lib import InvalidArgument, on_master_process
 from nngt.lib.logger import _log_message
 
 from ..geometry import Shape, _shapely_support
-from .io_helpers import _get_format
-from .saving_helpers import (_neighbour_list, _edge_list, _gml, _xml,
+from .io_helpers import _get_format, _open_file
+from .saving_helpers import (_neighbour_list, _edge_list, _gml, _xml, _csr,
                              _custom_info, _gml_info, _xml_info,
-                             _str_bytes_len)
+                             _num_array_to_str)
 
 
 logger = logging.getLogger(__name__)
@@ -34,19 +35,15 @@ logger = logging.getLogger(__name__)
 # Formatting #
 # ---------- #
 
-di_format = {
-    "neighbour": _neighbour_list,
-    "edge_list": _edge_list,
-    "gml": _gml,
-    "graphml": _xml,
-    "xml": _xml,
+# writer and notifier formatter of each text format
+_format_table = {
+    "neighbour": (_neighbour_list, _custom_info),
+    "edge_list": (_edge_list, _custom_info),
+    "gml": (_gml, _gml_info),
+    "graphml": (_xml, _xml_info),
+    "xml": (_xml, _xml_info),
 }
 
-format_graph_info = defaultdict(lambda: _custom_info)
-format_graph_info["gml"] = _gml_info
-format_graph_info["xml"] = _xml_info
-format_graph_info["graphml"] = _xml_info
-
 
 # --------------- #
 # Saving function #
@@ -64,7 +61,9 @@ def save_to_file(graph, filename, fmt="auto", separator=" ",
     graph : :class:`~nngt.Graph` or subclass
         Graph to save.
     filename: str
-        The path to the file.
+        The path to the file. Text formats can be compressed with gzip, bzip2
+        or xz, which is detected from a final '.gz', '.bz2' or '.xz'
+        extension.
     fmt : str, optional (default: "auto")
         The format used to save the graph. Supported formats are: "neighbour"
         (neighbour list, default if format cannot be deduced automatically),
@@ -74,7 +73,9 @@ def save_to_file(graph, filename, fmt="auto", separator=" ",
         (graphml format, default if `filename` ends with '.graphml' or '.xml'),
         "dot" (dot format, default if `filename` ends with '.dot'), "gt" (only
         when using `graph_tool <http://graph-tool.skewed.de/>`_ as library,
-        detected if `filename` ends with '.gt').
+        detected if `filename` ends with '.gt'), "csr" (binary NumPy archive
+        containing the CSR structure of the graph and its attributes, detected
+        if `filename` ends with '.npz').
     separator : str, optional (default " ")
         separator used to separate inputs in the case of custom formats (namely
         "neighbour" and "edge_list")
@@ -99,6 +100,26 @@ def save_to_file(graph, filename, fmt="auto", separator=" ",
     '''
     fmt = _get_format(fmt, filename)
 
+    if fmt == "csr":
+        if nngt.get_config("mpi"):
+            raise NotImplementedError("The 'csr' format is not available "
+                                      "with MPI.")
+
+        additional_notif = _get_info(graph, fmt=fmt, attributes=attributes)
+
+        arrays = _csr(graph, attributes=additional_notif["edge_attributes"],
+                      additional_notif=additional_notif)
+
+        # numpy scalars (e.g. in area properties) are not JSON serializable
+        header = json.dumps(additional_notif,
+                            default=lambda v: np.asarray(v).tolist())
+
+        # use a file object so that numpy does not append '.npz' to filename
+        with open(filename, "wb") as f_graph:
+            np.savez(f_graph, header=header, **arrays)
+
+        return
+
     # check for mpi
     if nngt.get_config("mpi"):
         from mpi4py import MPI
@@ -114,28 +135,29 @@ def save_to_file(graph, filename, fmt="auto", separator=" ",
         if on_master_process():
             for key, val in iter(di_notif.items()):
                 str_notif += "{}{}={}\n".format(notifier, key, val)
-        # strings need to start with a newline because MPI strips last
-        str_local = "\n" + str_local
-        # gather all strings sizes
-        sizes = comm.allgather(
-            _str_bytes_len(str_local) + _str_bytes_len(str_notif))
+        # encode once: strings need to start with a newline because MPI
+        # strips last
+        buf_notif = str_notif.encode('utf-8')
+        buf_local = ("\n" + str_local).encode('utf-8')
+        # gather all buffer sizes
+        sizes = comm.allgather(len(buf_local) + len(buf_notif))
         # get rank-based offset
-        offset = [_str_bytes_len(str_notif)]
+        offset = [len(buf_notif)]
         offset.extend(np.cumsum(sizes)[:-1])
         # open file and write
         if on_master_process():
-            with open(filename, "w") as f_graph:
-                f_graph.write(str_notif)
+            with open(filename, "wb") as f_graph:
+                f_graph.write(buf_notif)
         # parallel write
         amode = MPI.MODE_WRONLY
         fh = MPI.File.Open(comm, filename, amode)
-        fh.Write_at_all(offset[rank], str_local.encode('utf-8'))
+        fh.Write_at_all(offset[rank], buf_local)
         fh.Close()
     else:
         str_graph = _as_string(
             graph, separator=separator, fmt=fmt, secondary=secondary,
             attributes=attributes, notifier=notifier)
-        with open(filename, "w") as f_graph:
+        with _open_file(filename, "wt") as f_graph:
             f_graph.write(str_graph)
 
 
@@ -187,6 +209,13 @@ def _as_string(graph, fmt="neighbour", separator=" ", secondary=";",
         The full graph representation as a string.
     '''
     # checks
+    try:
+        writer, info_formatter = _format_table[fmt]
+    except KeyError:
+        raise InvalidArgument(
+            "Unsupported format '{}', available formats are {}.".format(
+                fmt, list(_format_table)))
+
     if separator == secondary and fmt != "edge_list":
         raise InvalidArgument("`separator` and `secondary` strings must be "
                               "different.")
@@ -195,37 +224,66 @@ def _as_string(graph, fmt="neighbour", separator=" ", secondary=";",
         raise InvalidArgument("`notifier` string should differ from "
                               "`separator` and `secondary`.")
 
-    # temporarily disable numpy cut threshold to save string
-    old_threshold = np.get_printoptions()['threshold']
-    np.set_printoptions(threshold=sys.maxsize)
+    additional_notif = _get_info(graph, fmt=fmt, separator=separator,
+                                 attributes=attributes)
+
+    attributes = additional_notif["edge_attributes"]
+
+    # array-valued attributes must not be truncated when printed
+    with np.printoptions(threshold=sys.maxsize):
+        str_graph = writer(graph, separator=separator, secondary=secondary,
+                           attributes=attributes,
+                           additional_notif=additional_notif)
 
+    if return_info:
+        return str_graph, additional_notif
+
+    # format the info into the string
+    info_str = info_formatter(additional_notif, notifier, graph=graph)
+
+    return info_str + str_graph
+
+
+def _get_info(graph, fmt="neighbour", separator=" ", attributes=None):
+    '''
+    Return the notifiers describing the graph (properties, attributes, shape,
+    positions and structure) as a dict.
+
+    Node attributes and positions are only converted to strings for text
+    formats.
+    '''
     # data
     if attributes is None:
         attributes = [a for a in graph.edge_attributes if a != "bweight"]
 
     nattributes = [a for a in graph.node_attributes]
 
+    # get all attribute types at once
+    ntypes = graph.node_attributes.value_type()
+    etypes = graph.edge_attributes.value_type()
+
     additional_notif = {
         "directed": graph.is_directed(),
         "node_attributes": nattributes,
-        "node_attr_types": [
-            graph.get_attribute_type(nattr, "node") for nattr in nattributes
-        ],
+        "node_attr_types": [ntypes[nattr] for nattr in nattributes],
         "edge_attributes": attributes,
-        "edge_attr_types": [
-            graph.get_attribute_type(attr, "edge") for attr in attributes
-        ],
+        "edge_attr_types": [etypes[attr] for attr in attributes],
         "name": graph.name,
         "size": graph.node_nb()
     }
 
     # add node attributes to the notifications
-    if fmt != "graphml":
+    if fmt not in ("graphml", "csr"):
         for nattr in additional_notif["node_attributes"]:
-            key = "na_" + nattr
+            key    = "na_" + nattr
+            values = np.asarray(graph.get_node_attributes(name=nattr))
+
+            if values.dtype.kind in "iuf":
+                additional_notif[key] = _num_array_to_str(values, separator)
+                continue
 
             tmp = np.array2string(
-                graph.get_node_attributes(name=nattr), max_line_width=np.NaN,
+                values, max_line_width=np.NaN, threshold=sys.maxsize,
                 separator=separator)[1:-1].replace("'" + separator + "'",
                                                    '"' + separator + '"')
 
@@ -264,48 +322,36 @@ def _as_string(graph, fmt="neighbour", separator=" ", secondary=";",
                          'The `shape` attribute of the graph could not be '
                          'saved to file because Shapely is not installed.')
 
-        pos = graph.get_positions()
-        additional_notif['x'] = np.array2string(
-            pos[:, 0], max_line_width=np.NaN, separator=separator)[1:-1]
-        additional_notif['y'] = np.array2string(
-            pos[:, 1], max_line_width=np.NaN, separator=separator)[1:-1]
-        if pos.shape[1] == 3:
-            additional_notif['z'] = np.array2string(
-                pos[:, 2], max_line_width=np.NaN, separator=separator)[1:-1]
+        # positions are stored as an array in binary files
+        if fmt != "csr":
+            pos = graph.get_positions()
+            additional_notif['x'] = _num_array_to_str(pos[:, 0], separator)
+            additional_notif['y'] = _num_array_to_str(pos[:, 1], separator)
+            if pos.shape[1] == 3:
+                additional_notif['z'] = _num_array_to_str(pos[:, 2],
+                                                          separator)
 
     if graph.structure is not None:
-        # temporarily remove weakrefs
-        graph.structure._parent = None
-        for g in graph.structure.values():
-            g._struct = None
-            g._net    = None
-        # save as string
-        if nngt.get_config("mpi"):
-            if nngt.get_config("mpi_comm").Get_rank() == 0:
-                additional_notif["structure"] = codecs.encode(
-                    pickle.dumps(graph.structure, protocol=2),
-                                 "base64").decode().replace('\n', '~')
-        else:
-            additional_notif["structure"] = codecs.encode(
-                pickle.dumps(graph.structure, protocol=2),
-                             "base64").decode().replace('\n', '~')
-        # restore weakrefs
-        graph.structure._parent = weakref.ref(graph)
-        for g in graph.structure.values():
-            g._struct = weakref.ref(graph.structure)
-            g._net    = weakref.ref(graph)
-
-    str_graph = di_format[fmt](graph, separator=separator,
-                               secondary=secondary, attributes=attributes,
-                               additional_notif=additional_notif)
-
-    # set numpy cut threshold back on
-    np.set_printoptions(threshold=old_threshold)
+        # save as a single-line base64 string
+        if not nngt.get_config("mpi") or \
+           nngt.get_config("mpi_comm").Get_rank() == 0:
+            additional_notif["structure"] = base64.b64encode(
+                _pickle_structure(graph.structure)).decode("ascii")
 
-    if return_info:
-        return str_graph, additional_notif
+    return additional_notif
 
-    # format the info into the string
-    info_str = format_graph_info[fmt](additional_notif, notifier, graph=graph)
 
-    return info_str + str_graph
+def _pickle_structure(structure):
+    '''
+    Pickle a structure, replacing the weakrefs of the structure and of its
+    groups to their parents by None (they cannot be pickled).
+    '''
+    buffer  = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[weakref.ref] = lambda ref: (type(None), ())
+
+    pickler.dump(structure)
+
+    return buffer.getvalue()
@@ -5,6 +5,11 @@
 
 """ IO helpers """
 
+import bz2
+import gzip
+import lzma
+import os
+
 import nngt
 from nngt.lib import InvalidArgument
 
@@ -13,23 +18,48 @@ from nngt.lib import InvalidArgument
 # Saving tools #
 # ------------ #
 
+_ext_to_format = {
+    '.gml': 'gml',
+    '.graphml': 'graphml',
+    '.xml': 'graphml',
+    '.dot': 'dot',
+    '.gt': 'gt',
+    '.nn': 'neighbour',
+    '.el': 'edge_list',
+    '.npz': 'csr',
+}
+
+
+# text files compressed with these extensions are (de)compressed on the fly
+_compression_to_open = {
+    '.gz': gzip.open,
+    '.bz2': bz2.open,
+    '.xz': lzma.open,
+}
+
+
+def _open_file(filename, mode="rt"):
+    ''' Open a file, decompressing it on the fly if necessary '''
+    ext = os.path.splitext(filename)[1].lower()
+
+    return _compression_to_open.get(ext, open)(filename, mode)
+
+
 def _get_format(fmt, filename):
     if fmt == "auto":
-        if filename.endswith('.gml'):
-            fmt = 'gml'
-        elif filename.endswith('.graphml') or filename.endswith('.xml'):
-            fmt = 'graphml'
-        elif filename.endswith('.dot'):
-            fmt = 'dot'
-        elif (filename.endswith('.gt') and
-              nngt._config["backend"] == "graph-tool"):
-            fmt = 'gt'
-        elif filename.endswith('.nn'):
-            fmt = 'neighbour'
-        elif filename.endswith('.el'):
-            fmt = 'edge_list'
-        else:
+        root, ext = os.path.splitext(filename)
+
+        # use the extension before the compression one
+        if ext.lower() in _compression_to_open:
+            ext = os.path.splitext(root)[1]
+
+        fmt = _ext_to_format.get(ext.lower())
+
+        # graph-tool binary files can only be read by graph-tool
+        if fmt == 'gt' and nngt._config["backend"] != "graph-tool":
+            fmt = None
+
+        if fmt is None:
             raise InvalidArgument('Could not determine format from filename '
                                   'please specify `fmt`.')
     return fmt
-
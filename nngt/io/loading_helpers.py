@@ -6,6 +6,9 @@
 """ Loading helpers """
 
 from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+import json
 import logging
 import re
 import types
@@ -15,6 +18,7 @@ import numpy as np
 from ..lib.logger import _log_message
 from ..lib.converters import (_np_dtype, _to_int, _to_string, _to_list,
                               _string_from_object, _python_type, _default_value)
+from .io_helpers import _open_file
 
 
 __all__ = [
@@ -26,6 +30,7 @@ __all__ = [
     "_get_edges_neighbour",
     "_get_node_attr",
     "_get_notif",
+    "_load_csr",
     "_process_file",
 ]
 
@@ -38,49 +43,68 @@ logger = logging.getLogger(__name__)
 # ----------------------- #
 
 def _process_file(f, fmt, separator):
+    # collapse repeated separators in the whole file with a single call
+    text  = _separator_pattern(separator).sub(separator, f.read())
+    lines = text.split("\n")
+
+    # a final line end does not start a new line
+    if lines[-1] == "":
+        lines.pop()
+
     if fmt == "gml":
         # format gml input to expected one
-        lines = []
+        gml_lines = []
 
-        for l in f.readlines():
-            clean_line = _cleanup_line(l, separator)
+        for l in lines:
+            clean_line = l.strip()
 
             if clean_line.endswith("[") and len(clean_line) > 1:
-                lines.append(clean_line[:-1].strip())
-                lines.append("[")
+                gml_lines.append(clean_line[:-1].strip())
+                gml_lines.append("[")
             elif clean_line.endswith("]") and len(clean_line) > 1:
-                lines.append(clean_line[:-1].strip())
-                lines.append("]")
+                gml_lines.append(clean_line[:-1].strip())
+                gml_lines.append("]")
             elif clean_line:
-                lines.append(clean_line)
+                gml_lines.append(clean_line)
 
-        return lines
+        return gml_lines
 
-    # otherwise just cleanup the lines
-    return [_cleanup_line(line, separator) for line in f.readlines() if line]
+    # otherwise just strip the lines
+    return [line.strip() for line in lines]
 
 
 # ---------------- #
 # Graph properties #
 # ---------------- #
 
+def _parse_notif_list(notif_val):
+    lst = notif_val[1:-1].split(", ")
+
+    if lst != ['']:  # check empty string
+        return [val.strip("'\"") for val in lst]
+
+    return []
+
+
+def _parse_directed(notif_val):
+    return notif_val not in ("False", "0")
+
+
+# parsers for the notifiers that are not plain strings
+_notif_parsers = {
+    "node_attributes": _parse_notif_list,
+    "edge_attributes": _parse_notif_list,
+    "node_attr_types": _parse_notif_list,
+    "edge_attr_types": _parse_notif_list,
+    "size": int,
+    "directed": _parse_directed,
+}
+
+
 def _format_notif(notif_name, notif_val):
-    attr = (
-        "node_attributes", "edge_attributes", "node_attr_types",
-        "edge_attr_types"
-    )
-    if notif_name in attr:
-        lst = notif_val[1:-1].split(", ")
-        if lst != ['']:  # check empty string
-            return [val.strip("'\"") for val in lst]
-        else:
-            return []
-    elif notif_name == "size":
-        return int(notif_val)
-    elif notif_name == "directed":
-        return False if notif_val in ("False", "0") else True
-    else:
-        return notif_val
+    parser = _notif_parsers.get(notif_name)
+
+    return notif_val if parser is None else parser(notif_val)
 
 
 def _get_notif(filename, lines, notifier, attributes, fmt=None, atypes=None):
@@ -98,8 +122,14 @@ def _get_notif(filename, lines, notifier, attributes, fmt=None, atypes=None):
                 start = i
                 break
 
-        nodes = [i for i, l in enumerate(lines) if l == "node" and i > start]
-        edges = [i for i, l in enumerate(lines) if l == "edge" and i > start]
+        # locate node and edge blocks in a single pass after the header
+        nodes, edges = [], []
+
+        for i, l in enumerate(islice(lines, start + 1, None), start + 1):
+            if l == "node":
+                nodes.append(i)
+            elif l == "edge":
+                edges.append(i)
 
         num_nodes = len(nodes)
         num_edges = len(edges)
@@ -178,11 +208,16 @@ def _get_notif(filename, lines, notifier, attributes, fmt=None, atypes=None):
             import xml.etree.ElementTree as ET
             from io import StringIO
 
-        root = ET.parse(filename).getroot()
+        with _open_file(filename, "rb") as f:
+            root = ET.parse(f).getroot()
 
-        ns = root.nsmap if lxml else dict([
-                node for _, node in ET.iterparse(filename, events=['start-ns'])
-             ])
+        if lxml:
+            ns = root.nsmap
+        else:
+            with _open_file(filename, "rb") as f:
+                ns = dict([
+                    node for _, node in ET.iterparse(f, events=['start-ns'])
+                ])
 
         di_notif["namespace"] = ns
 
@@ -260,33 +295,49 @@ def _get_edges_neighbour(lst_lines, attributes, ignore, notifier, separator,
     Add edges and attributes to `edges` and `di_attributes` for the "neighbour"
     format.
     '''
-    edges = []
+    sources, neighbours = [], []
 
-    lst_lines = lst_lines[::-1]
+    skip = (notifier, ignore)
 
-    while lst_lines:
-        line = lst_lines.pop()
+    for line in lst_lines:
+        if line and not line.startswith(skip):
+            source, found, stubs = line.partition(separator)
 
-        if line and not (line.startswith(notifier) or line.startswith(ignore)):
-            len_first_delim = line.find(separator)
+            if found and source:
+                sources.append(source)
+                neighbours.append(stubs)
 
-            if len_first_delim > 0:
-                source = int(line[:len_first_delim])
-                len_first_delim += 1
+    if not sources:
+        return np.empty((0, 2), dtype=np.int64)
 
-                if len_first_delim:
-                    neighbours = line[len_first_delim:].split(separator)
+    # split all the stubs at once, then each stub into target and attributes
+    counts = [stubs.count(separator) + 1 for stubs in neighbours]
+    stubs  = separator.join(neighbours).split(separator)
+    width  = stubs[0].count(secondary) + 1
 
-                    for stub in neighbours:
-                        content = stub.split(secondary)
-                        target = int(content[0])
+    if all(stub.count(secondary) == width - 1 for stub in stubs):
+        # all stubs have the same number of attributes
+        fields  = secondary.join(stubs).split(secondary) if width > 1 \
+                  else stubs
+        columns = [fields[i::width] for i in range(width)]
+    else:
+        content = [stub.split(secondary) for stub in stubs]
+        columns = [[c[i] for c in content if len(c) > i]
+                   for i in range(max(len(c) for c in content))]
 
-                        edges.append((source, target))
+    edges = np.empty((len(stubs), 2), dtype=np.int64)
 
-                        attr_val = content[1:] if len(content) > 1 else []
+    edges[:, 0] = np.repeat(np.array(sources, dtype=np.int64), counts)
+    edges[:, 1] = np.array(columns[0], dtype=np.int64)
 
-                        for name, val in zip(attributes, attr_val):
-                            di_attributes[name].append(convertor[name](val))
+    for name, values in zip(attributes, columns[1:]):
+        conv = convertor[name]
+
+        # numeric columns are kept as arrays
+        if conv is float:
+            di_attributes[name] = np.array(values, dtype=float)
+        else:
+            di_attributes[name].extend(map(conv, values))
 
     return edges
 
@@ -297,26 +348,52 @@ def _get_edges_elist(lst_lines, attributes, ignore, notifier, separator,
     Add edges and attributes to `edges` and `di_attributes` for the edge list
     format.
     '''
-    edges = []
+    skip  = (notifier, ignore)
+    lines = [line for line in lst_lines if line and not line.startswith(skip)]
+
+    if not lines:
+        return np.empty((0, 2), dtype=np.int64)
+
+    data = lines[0].split(separator)
+
+    # different ways of loading the attributes
+    with_secondary = len(data) == 3 and secondary in data[2]
+    with_columns   = not with_secondary and len(data) == len(attributes) + 2
+
+    if attributes and with_columns:
+        # parse the ids and attribute columns at once with numpy's C parser,
+        # float columns directly as floats, the others as strings
+        dtype = [("source", np.int64), ("target", np.int64)] + [
+            ("a{}".format(i), float if convertor[name] is float else object)
+            for i, name in enumerate(attributes)
+        ]
+
+        table = np.loadtxt(lines, delimiter=separator, comments=None,
+                           dtype=dtype, ndmin=1)
+
+        edges = np.column_stack((table["source"], table["target"]))
+
+        for i, name in enumerate(attributes):
+            conv   = convertor[name]
+            values = table["a{}".format(i)]
 
-    lst_lines = lst_lines[::-1]
+            # numeric columns are kept as arrays
+            if conv is float:
+                di_attributes[name] = values
+            else:
+                di_attributes[name].extend(map(conv, values.tolist()))
 
-    while lst_lines:
-        line = lst_lines.pop()
+        return edges
 
-        if line and not (line.startswith(notifier) or line.startswith(ignore)):
-            data = line.split(separator)
-            source, target = int(data[0]), int(data[1])
-            edges.append((source, target))
+    # parse whole columns at once with numpy's C parser
+    edges = np.loadtxt(lines, delimiter=separator, comments=None,
+                       usecols=(0, 1), dtype=np.int64, ndmin=2)
 
-            # different ways of loading the attributes
-            if len(data) == 3 and secondary in data[2]:  # secondary notifier
-                attr_data = data[2].split(secondary)
-                for name, val in zip(attributes, attr_data):
-                    di_attributes[name].append(convertor[name](val))
-            elif len(data) == len(attributes) + 2:  # regular columns
-                for name, val in zip(attributes, data[2:]):
-                    di_attributes[name].append(convertor[name](val))
+    if attributes and with_secondary:
+        for line in lines:
+            attr_data = line.split(separator)[2].split(secondary)
+            for name, val in zip(attributes, attr_data):
+                di_attributes[name].append(convertor[name](val))
 
     return edges
 
@@ -326,21 +403,25 @@ def _get_edges_gml(lst_lines, attributes, *args, di_attributes=None,
     '''
     Add edges and attributes to `edges` and `di_attributes` for the gml format.
     '''
-    edges = []
+    starts = di_notif["edges"]
 
-    num_eattr  = len(di_attributes)
+    edges = np.empty((len(starts), 2), dtype=np.int64)
 
-    for line_num in di_notif["edges"]:
-        source = int(lst_lines[line_num + 2][7:])
-        target = int(lst_lines[line_num + 3][7:])
+    # read the blocks column by column: "source ..." and "target ..." lines
+    # come first, then one line per attribute
+    for col, offset in enumerate((2, 3)):
+        edges[:, col] = np.array(
+            [lst_lines[l + offset][7:] for l in starts], dtype=np.int64)
 
-        edges.append((source, target))
+    for offset, name in enumerate(attributes, 4):
+        conv   = convertor[name]
+        values = [lst_lines[l + offset].partition(" ")[2] for l in starts]
 
-        for i, name in enumerate(attributes):
-            lnum  = line_num + 4 + i
-            start = lst_lines[lnum].find(" ") + 1
-            attr  = lst_lines[lnum][start:]
-            di_attributes[name].append(convertor[name](attr))
+        # numeric columns are kept as arrays
+        if conv is float:
+            di_attributes[name] = np.array(values, dtype=float)
+        else:
+            di_attributes[name].extend(map(conv, values))
 
     return edges
 
@@ -459,14 +540,14 @@ def _get_node_attr(di_notif, separator, fmt=None, lines=None, convertor=None):
                          "have been replaced by default values.")
     else:
         # edge list and neighbors formatting
-        nattr_name = {str("na_" + k): k for k in di_notif["node_attributes"]}
-        nattr_type = di_notif["node_attr_types"]
+        nattributes = zip(di_notif["node_attributes"],
+                          di_notif["node_attr_types"])
+
+        for attr, attr_type in nattributes:
+            s = di_notif.get("na_" + attr)
 
-        for k, s in di_notif.items():
-            if k in nattr_name:
-                attr  = nattr_name[k]
-                idx   = di_notif["node_attributes"].index(attr)
-                dtype = _np_dtype(nattr_type[idx])
+            if s is not None:
+                dtype = _np_dtype(attr_type)
 
                 if dtype == object:
                     char = "" if s.strip()[0] != '"' else '"'
@@ -478,15 +559,65 @@ def _get_node_attr(di_notif, separator, fmt=None, lines=None, convertor=None):
                     if s.endswith(char):
                         s = s[:-1]
 
-                    di_nattr[attr] = np.array(
-                        [w for w in s.split(nsep)], dtype=dtype)
+                    di_nattr[attr] = np.array(s.split(nsep), dtype=dtype)
                 else:
+                    # numpy's C parser reads the whole column at once
                     di_nattr[attr] = np.fromstring(s, sep=separator,
                                                    dtype=dtype)
 
     return di_nattr
 
 
+# ------------ #
+# Binary files #
+# ------------ #
+
+def _load_csr(filename):
+    '''
+    Load the notifiers, edges, node and edge attributes, and positions from a
+    binary file saved with the "csr" format.
+
+    The archive is read without unpickling, except if its header declares
+    "object" attributes: these can only be stored as pickled arrays, so the
+    file is then reopened with `allow_pickle=True` (only load such files from
+    trusted sources).
+    Note that a structure (groups or population) stored in the header is
+    always unpickled afterwards, as for the text formats.
+    '''
+    with np.load(filename, allow_pickle=False) as data:
+        di_notif = json.loads(data["header"].item())
+
+        attr_types = \
+            di_notif["node_attr_types"] + di_notif["edge_attr_types"]
+
+        if "object" not in attr_types:
+            return _read_csr(data, di_notif)
+
+    with np.load(filename, allow_pickle=True) as data:
+        return _read_csr(data, di_notif)
+
+
+def _read_csr(data, di_notif):
+    ''' Read the arrays of an opened "csr" archive. '''
+    indptr = data["indptr"]
+
+    edges = np.empty((indptr[-1], 2), dtype=np.int64)
+    edges[:, 0] = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    edges[:, 1] = data["indices"]
+
+    di_nattr = {
+        name: data["na_" + name] for name in di_notif["node_attributes"]
+    }
+
+    di_eattr = {
+        name: data["ea_" + name] for name in di_notif["edge_attributes"]
+    }
+
+    positions = data["positions"] if "positions" in data else None
+
+    return di_notif, edges, di_nattr, di_eattr, positions
+
+
 # ---------- #
 # Converters #
 # ---------- #
@@ -508,13 +639,7 @@ def _gen_convert(attributes, attr_types, attributes_types=None):
         elif attr_type in ("double", "float", "real"):
             di_convert[attr] = float
         elif attr_type in ("str", "string"):
-            def string_convertor(s):
-                if s:
-                    start, end = s[0], s[-1]
-                    if start == end and start in ("'", '"'):
-                        return s[1:-1]
-                return s
-            di_convert[attr] = lambda x: string_convertor(x)
+            di_convert[attr] = _strip_quotes
         elif attr_type in ("int", "integer"):
             di_convert[attr] = _to_int
         elif attr_type in ("lst", "list", "tuple", "array"):
@@ -525,8 +650,21 @@ def _gen_convert(attributes, attr_types, attributes_types=None):
     return di_convert
 
 
+def _strip_quotes(s):
+    ''' Remove the quotes surrounding a string attribute '''
+    if s:
+        start, end = s[0], s[-1]
+        if start == end and start in ("'", '"'):
+            return s[1:-1]
+    return s
+
+
 def _cleanup_line(string, char):
     ''' Replace multiple occurrences of a separator and remove line ends '''
-    pattern = char + '+'
-    string = re.sub(pattern, char, string)
-    return string.strip()
+    return _separator_pattern(char).sub(char, string).strip()
+
+
+@lru_cache(maxsize=None)
+def _separator_pattern(char):
+    ''' Compiled pattern matching repeated occurrences of a separator '''
+    return re.compile(re.escape(char) + '+')
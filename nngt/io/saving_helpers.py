@@ -6,6 +6,9 @@
 """ IO tools for NNGT """
 
 import logging
+from itertools import repeat
+
+import numpy as np
 
 from nngt.lib.logger import _log_message
 
@@ -16,36 +19,65 @@ def _neighbour_list(graph, separator, secondary, attributes, **kwargs):
     '''
     Generate a string containing the neighbour list of the graph as well as a
     dict containing the notifiers as key and the associated values.
-    @todo: speed this up!
     '''
-    lst_neighbours = None
+    num_nodes = graph.node_nb()
 
-    if graph.is_directed():
-        lst_neighbours = list(graph.adjacency_matrix(mformat="lil").rows)
-    else:
-        import scipy.sparse as ssp
-        lst_neighbours = list(
-            ssp.tril(graph.adjacency_matrix(), format="lil").rows)
+    order, indptr, cols = _csr_order(graph)
 
-    for v1 in range(graph.node_nb()):
-        for i, v2 in enumerate(lst_neighbours[v1]):
-            str_edge = str(v2)
+    di_attributes = {
+        k: v for k, v in graph.edge_attributes.items()
+        if k != 'bweight'
+    }
 
-            eattr = graph.get_edge_attributes((v1, v2))
+    lst_edges = [str(v2) for v2 in cols[order].tolist()]
 
-            for attr in attributes:
-                str_edge += "{}{}".format(secondary, eattr[attr])
+    for attr in attributes:
+        values = _as_pylist(np.asarray(di_attributes[attr])[order])
 
-            lst_neighbours[v1][i] = str_edge
+        lst_edges = [
+            "{}{}{}".format(str_edge, secondary, val)
+            for str_edge, val in zip(lst_edges, values)
+        ]
 
-        lst_neighbours[v1] = "{}{}{}".format(
-            v1, separator, separator.join(lst_neighbours[v1]))
+    lst_neighbours = [
+        "{}{}{}".format(
+            v1, separator, separator.join(lst_edges[indptr[v1]:indptr[v1+1]]))
+        for v1 in range(num_nodes)
+    ]
 
     str_neighbours = "\n".join(lst_neighbours)
 
     return str_neighbours
 
 
+def _csr(graph, attributes, additional_notif, **kwargs):
+    '''
+    Generate a dict containing the CSR structure of the graph (`indptr` and
+    `indices`), the edge and node attributes, and the positions, as arrays.
+    '''
+    order, indptr, indices = _csr_order(graph)
+
+    arrays = {"indptr": indptr, "indices": indices[order]}
+
+    etypes = additional_notif["edge_attr_types"]
+
+    for attr, dtype in zip(attributes, etypes):
+        values = np.asarray(graph.edge_attributes[attr])[order]
+        arrays["ea_" + attr] = _as_binary(values, dtype)
+
+    nattributes = additional_notif["node_attributes"]
+    ntypes      = additional_notif["node_attr_types"]
+
+    for nattr, dtype in zip(nattributes, ntypes):
+        values = np.asarray(graph.node_attributes[nattr])
+        arrays["na_" + nattr] = _as_binary(values, dtype)
+
+    if graph.is_spatial():
+        arrays["positions"] = graph.get_positions()
+
+    return arrays
+
+
 def _edge_list(graph, separator, secondary, attributes, **kwargs):
     ''' Generate a string containing the edge list and their properties. '''
     edges = graph.edges_array
@@ -55,22 +87,22 @@ def _edge_list(graph, separator, secondary, attributes, **kwargs):
         if k != 'bweight'
     }
 
-    end_strings = (len(attributes) - 1)*[secondary]
-
-    end_strings.append('')
-
-    lst_edges = []
+    lst_edges = [
+        "{}{}{}".format(v1, separator, v2)
+        for v1, v2 in np.asarray(edges).reshape(-1, 2).tolist()
+    ]
 
-    for i, e in enumerate(edges):
-        str_edge = "{}{}{}".format(e[0], separator, e[1])
-
-        if attributes:
-            str_edge += separator
-
-        for end, attr in zip(end_strings, attributes):
-            str_edge += "{}{}".format(di_attributes[attr][i], end)
+    if attributes:
+        # format each attribute column once, then join them edge by edge
+        str_attributes = [
+            list(map("{}".format, _as_pylist(di_attributes[attr])))
+            for attr in attributes
+        ]
 
-        lst_edges.append(str_edge)
+        lst_edges = [
+            "{}{}{}".format(str_edge, separator, secondary.join(str_attr))
+            for str_edge, str_attr in zip(lst_edges, zip(*str_attributes))
+        ]
 
     str_edges = "\n".join(lst_edges)
 
@@ -85,37 +117,36 @@ def _gml(graph, *args, **kwargs):
     ''' Generate a string containing the edge list and their properties. '''
     node_str = "  node\n  [\n    id {id}{attr}\n  ]"
     edge_str = "  edge\n  [\n    source {s}\n    target {t}\n{attr}\n  ]"
-    attr_str = "    {key} {val}"
-
-    indent = "    "
-
-    # set nodes
-    lst_elements = []
+    attr_str = "    {} {}"
 
-    for i in range(graph.node_nb()):
-        lst_attr = []
+    # format each attribute column once
+    node_cols = [
+        [attr_str.format(k, val) for val in _as_pylist(v)]
+        for k, v in graph.node_attributes.items()
+    ]
 
-        for k, v in graph.node_attributes.items():
-            lst_attr.append(attr_str.format(key=k, val=v[i]))
+    edge_cols = [
+        [attr_str.format(k, val) for val in _as_pylist(v)]
+        for k, v in graph.edge_attributes.items()
+    ]
 
-        nattr = "\n" + "\n".join(lst_attr)
+    # set nodes
+    node_attrs = zip(*node_cols) if node_cols else repeat((), graph.node_nb())
 
-        lst_elements.append(node_str.format(id=i, attr=nattr))
+    lst_elements = [
+        node_str.format(id=i, attr="\n" + "\n".join(attrs))
+        for i, attrs in enumerate(node_attrs)
+    ]
 
     # set edges
-    edges = graph.edges_array
-
-    for i, e in enumerate(edges):
-        lst_attr = []
-
-        attrs = graph.get_edge_attributes(e)
+    edges = np.asarray(graph.edges_array).reshape(-1, 2).tolist()
 
-        for k, v in attrs.items():
-            lst_attr.append(attr_str.format(key=k, val=v))
+    edge_attrs = zip(*edge_cols) if edge_cols else repeat((), len(edges))
 
-        eattr = "\n".join(lst_attr)
-
-        lst_elements.append(edge_str.format(s=e[0], t=e[1], attr=eattr))
+    lst_elements.extend(
+        edge_str.format(s=e[0], t=e[1], attr="\n".join(attrs))
+        for e, attrs in zip(edges, edge_attrs)
+    )
 
     str_gml = "\n".join(lst_elements)
 
@@ -251,5 +282,53 @@ def _xml_info(*args, **kwargs):
     return ""
 
 
-def _str_bytes_len(s):
-    return len(s.encode('utf-8'))
+def _csr_order(graph):
+    '''
+    Return the permutation sorting the edges in CSR order (by source, then by
+    target), the associated `indptr` array, and the (unsorted) targets.
+    '''
+    edges = np.asarray(graph.edges_array, dtype=int).reshape(-1, 2)
+
+    # undirected edges are listed once, from the node with the highest id
+    if graph.is_directed():
+        rows, cols = edges[:, 0], edges[:, 1]
+    else:
+        rows, cols = edges.max(axis=1), edges.min(axis=1)
+
+    order  = np.lexsort((cols, rows))
+    indptr = np.searchsorted(rows[order], np.arange(graph.node_nb() + 1))
+
+    return order, indptr, cols
+
+
+def _as_binary(values, dtype):
+    '''
+    Store string attributes as fixed-width unicode so that they can be
+    loaded without unpickling.
+    '''
+    if dtype == "string" and values.dtype == object:
+        return values.astype(str)
+
+    return values
+
+
+def _as_pylist(values):
+    '''
+    Convert `values` to a list of Python objects when this does not change
+    their string representation (integers and double precision floats),
+    which makes formatting much faster than with numpy scalars.
+    '''
+    values = np.asarray(values)
+
+    if values.dtype.kind in "iub" or values.dtype == np.float64:
+        return values.tolist()
+
+    return values
+
+
+def _num_array_to_str(values, separator):
+    '''
+    Join the values of a numeric array with `separator` (full precision, no
+    numpy printing machinery involved).
+    '''
+    return separator.join(map(str, np.asarray(values).tolist()))
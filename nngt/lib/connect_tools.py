@@ -6,11 +6,11 @@
 """ Generation tools for NNGT """
 
 import logging
+from functools import lru_cache
 
 import numpy as np
 import scipy.sparse as ssp
 from scipy.spatial.distance import cdist
-from numpy.random import randint
 
 import nngt
 from .errors import InvalidArgument
@@ -25,8 +25,11 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "_check_num_edges",
     "_compute_connections",
+    "_dist_kernel",
     "_filter",
+    "_filter_packed",
     "_no_self_loops",
+    "_pack_edges",
     "_set_degree_type",
     "_set_options",
     "_unique_rows",
@@ -50,15 +53,16 @@ def _compute_connections(num_source, num_target, density, edges, avg_deg,
         "'edges', 'avg_deg'."
 
     pre_recip_edges = 0
+    num_pairs       = num_source * num_target
 
     if avg_deg is not None:
         pre_recip_edges = int(avg_deg * num_source)
     elif edges is not None:
         pre_recip_edges = int(edges)
     else:
-        pre_recip_edges = int(density * num_source * num_target)
+        pre_recip_edges = int(density * num_pairs)
 
-    dens  = pre_recip_edges / float(num_source * num_target)
+    dens  = pre_recip_edges / float(num_pairs)
     edges = pre_recip_edges
 
     if edges:
@@ -87,9 +91,14 @@ def _check_num_edges(source_ids, target_ids, num_edges, directed, multigraph,
     has_only_one_population = (num_source == num_target)
 
     if has_only_one_population:
-        source_set = set(source_ids)
-        target_set = set(target_ids)
-        has_only_one_population = (source_set == target_set)
+        # identical arrays are the common case, otherwise compare sorted ids
+        has_only_one_population = (
+            np.array_equal(source_ids, target_ids)
+            or np.array_equal(np.sort(source_ids), np.sort(target_ids)))
+
+        if return_sets:
+            source_set = set(source_ids)
+            target_set = set(target_ids)
 
     if not has_only_one_population and not multigraph:
         b_d  = (num_edges > num_source*num_target)
@@ -130,14 +139,42 @@ def _set_degree_type(degree_type):
 # Edge checks and filtering #
 # ------------------------- #
 
+def _pack_edges(edges, num_nodes, directed=True):
+    '''
+    Pack each edge into a single int64 key ``source*num_nodes + target``
+    (with ``source <= target`` if `directed` is False).
+    '''
+    edges = np.asarray(edges)
+
+    if directed:
+        keys = edges[:, 0].astype(np.int64)
+        keys *= num_nodes
+        keys += edges[:, 1]
+    else:
+        keys = np.minimum(edges[:, 0], edges[:, 1]).astype(np.int64)
+        keys *= num_nodes
+        keys += np.maximum(edges[:, 0], edges[:, 1])
+
+    return keys
+
+
 def _unique_rows(arr, return_index=False):
     '''
     Keep only unique edges
     '''
-    b = np.ascontiguousarray(arr).view(
-        np.dtype((np.void, arr.dtype.itemsize * arr.shape[1])))
-    b, idx = np.unique(b, return_index=True)
-    unique = b.view(arr.dtype).reshape(-1, arr.shape[1]).astype(int)
+    arr = np.asarray(arr)
+
+    if arr.shape[1] == 2 and np.issubdtype(arr.dtype, np.integer) \
+       and len(arr) and arr.min() >= 0:
+        # edges: sort a single int64 key per row
+        keys = _pack_edges(arr, int(arr.max()) + 1)
+
+        _, idx = np.unique(keys, return_index=True)
+    else:
+        _, idx = np.unique(arr, axis=0, return_index=True)
+
+    unique = arr[idx].astype(int, copy=False)
+
     if return_index:
         return unique, idx
     return unique
@@ -149,8 +186,8 @@ def _no_self_loops(array, return_test=False):
     '''
     test = array[:, 0] != array[:, 1]
     if return_test:
-        return array[test, :].astype(int), test
-    return array[test, :].astype(int)
+        return array[test, :].astype(int, copy=False), test
+    return array[test, :].astype(int, copy=False)
 
 
 def _filter(ia_edges, ia_edges_tmp, num_ecurrent, edges_hash, b_one_pop,
@@ -167,34 +204,24 @@ def _filter(ia_edges, ia_edges_tmp, num_ecurrent, edges_hash, b_one_pop,
 
     if not multigraph:
         num_ecurrent = len(edges_hash)
-        if distance is not None:
-            for e, d in zip(ia_edges_tmp, dist_tmp):
-                tpl_e = tuple(e)
-
-                if tpl_e not in edges_hash:
-                    if directed or tpl_e not in recip_hash:
-                        ia_edges[num_ecurrent] = e
-                        distance.append(d)
-                        edges_hash.add(tpl_e)
-
-                        if not directed:
-                            recip_hash.add(tpl_e[::-1])
 
-                        num_ecurrent += 1
-        else:
-            for e in ia_edges_tmp:
-                tpl_e = tuple(e)
+        # single pass over the candidates, as plain tuples of Python ints
+        lst_edges = [tuple(e) for e in np.asarray(ia_edges_tmp).tolist()]
+        lst_dist  = [None]*len(lst_edges) if distance is None else dist_tmp
 
-                if tpl_e not in edges_hash:
-                    if directed or tpl_e not in recip_hash:
-                        ia_edges[num_ecurrent] = e
+        for tpl_e, d in zip(lst_edges, lst_dist):
+            if tpl_e not in edges_hash:
+                if directed or tpl_e not in recip_hash:
+                    ia_edges[num_ecurrent] = tpl_e
+                    edges_hash.add(tpl_e)
 
-                        edges_hash.add(tpl_e)
+                    if distance is not None:
+                        distance.append(d)
 
-                        if not directed:
-                            recip_hash.add(tpl_e[::-1])
+                    if not directed:
+                        recip_hash.add(tpl_e[::-1])
 
-                        num_ecurrent += 1
+                    num_ecurrent += 1
     else:
         num_added = len(ia_edges_tmp)
         ia_edges[num_ecurrent:num_ecurrent + num_added, :] = ia_edges_tmp
@@ -206,6 +233,86 @@ def _filter(ia_edges, ia_edges_tmp, num_ecurrent, edges_hash, b_one_pop,
     return ia_edges, num_ecurrent
 
 
+def _filter_packed(ia_edges, ia_edges_tmp, num_ecurrent, edges_keys,
+                   num_nodes, b_one_pop, multigraph, directed=True,
+                   distance=None, dist_tmp=None):
+    '''
+    Vectorized version of :func:`_filter` where the existing edges are
+    stored as a sorted array of int64 keys ``source*num_nodes + target``
+    (with ``source < target`` for undirected graphs) instead of a set of
+    tuples.
+
+    `ia_edges_tmp` can be either an (E, 2) array or a ``(sources, targets)``
+    tuple of 1D arrays, which avoids stacking the candidate edges when they
+    are drawn column by column.
+    `distance` can be a list, which is extended, or an array aligned with
+    `ia_edges`, which is filled in place.
+
+    Returns
+    -------
+    ia_edges, num_ecurrent, edges_keys
+    '''
+    if isinstance(ia_edges_tmp, tuple):
+        src_tmp, tgt_tmp = ia_edges_tmp
+    else:
+        src_tmp, tgt_tmp = ia_edges_tmp[:, 0], ia_edges_tmp[:, 1]
+
+    sources = src_tmp.astype(np.int64)
+    targets = tgt_tmp.astype(np.int64)
+
+    # rows that can be added (None means all of them), self-loops are masked
+    # here rather than copied out of ia_edges_tmp
+    idx = np.flatnonzero(sources != targets) if b_one_pop else None
+
+    if not multigraph:
+        if idx is not None:
+            sources, targets = sources[idx], targets[idx]
+
+        if directed:
+            keys = sources
+        else:
+            keys = np.minimum(sources, targets)
+            np.maximum(sources, targets, out=targets)
+
+        keys *= num_nodes
+        keys += targets
+
+        # keep the first occurrence of each new edge
+        keys, first = np.unique(keys, return_index=True)
+
+        pos = np.searchsorted(edges_keys, keys)
+
+        if len(edges_keys):
+            new = edges_keys[np.minimum(pos, len(edges_keys) - 1)] != keys
+            keys, first, pos = keys[new], first[new], pos[new]
+
+        first.sort()
+
+        idx = first if idx is None else idx[first]
+
+        # keys are new and sorted: insert them instead of re-sorting
+        edges_keys = np.insert(edges_keys, pos, keys)
+
+    if idx is not None:
+        src_tmp, tgt_tmp = src_tmp[idx], tgt_tmp[idx]
+
+        if dist_tmp is not None:
+            dist_tmp = dist_tmp[idx]
+
+    num_added = len(src_tmp)
+
+    ia_edges[num_ecurrent:num_ecurrent + num_added, 0] = src_tmp
+    ia_edges[num_ecurrent:num_ecurrent + num_added, 1] = tgt_tmp
+    num_ecurrent += num_added
+
+    if isinstance(distance, np.ndarray):
+        distance[num_ecurrent - num_added:num_ecurrent] = dist_tmp
+    elif distance is not None:
+        distance.extend(dist_tmp)
+
+    return ia_edges, num_ecurrent, edges_keys
+
+
 def _cleanup_edges(g, edges, attributes, duplicates, loops, existing, ignore):
     '''
     Cleanup an list of edges.
@@ -236,45 +343,53 @@ def _cleanup_edges(g, edges, attributes, duplicates, loops, existing, ignore):
 
             new_attr[k] = np.asarray(v, dtype=dtype)[test]
     else:
-        # check (also) either duplicates or existing
-        new_attr = {key: [] for key in attributes}
-        edge_set = set()
+        # check (also) either duplicates or existing using packed edge keys
+        edges     = np.asarray(edges, dtype=int).reshape(-1, 2)
+        num_nodes = g.node_nb()
+        keys      = _pack_edges(edges, num_nodes, directed)
+
+        is_existing = np.zeros(len(edges), dtype=bool)
 
-        new_edges = []
+        if existing and g.edge_nb():
+            old_keys    = _pack_edges(g.edges_array, num_nodes, directed)
+            is_existing = np.isin(keys, old_keys)
 
-        if existing:
-            edge_set = {tuple(e) for e in g.edges_array}
+        is_loop = (edges[:, 0] == edges[:, 1]) if loops \
+                  else np.zeros(len(edges), dtype=bool)
 
-        for i, e in enumerate(edges):
-            tpl_e = tuple(e)
+        # among the remaining edges, keep only the first occurrence
+        candidates = np.flatnonzero(~(is_existing | is_loop))
 
-            if tpl_e in edge_set or (not directed and tpl_e[::-1] in edge_set):
+        _, first = np.unique(keys[candidates], return_index=True)
+
+        keep = np.zeros(len(edges), dtype=bool)
+        keep[candidates[first]] = True
+
+        for i in np.flatnonzero(~keep):
+            tpl_e = tuple(edges[i].tolist())
+
+            if not is_loop[i] or is_existing[i]:
                 if ignore:
                     _log_message(logger, "INFO",
                                  "Existing edge {} ignored.".format(tpl_e))
                 else:
                     raise InvalidArgument(
                         "Edge {} already exists.".format(tpl_e))
-            elif loops and e[0] == e[1]:
-                if ignore:
-                    _log_message(logger, "INFO",
-                                 "Self-loop on {} ignored.".format(e[0]))
-                else:
-                    raise InvalidArgument("Self-loop on {}.".format(e[0]))
+            elif ignore:
+                _log_message(logger, "INFO",
+                             "Self-loop on {} ignored.".format(tpl_e[0]))
             else:
-                edge_set.add(tpl_e)
-                new_edges.append(tpl_e)
+                raise InvalidArgument("Self-loop on {}.".format(tpl_e[0]))
 
-                if not directed:
-                    edge_set.add(tpl_e[::-1])
+        kept = np.flatnonzero(keep)
 
-                for k, vv in attributes.items():
-                    if nonstring_container(vv):
-                        new_attr[k].append(vv[i])
-                    else:
-                        new_attr[k].append(vv)
+        new_edges = edges[kept]
 
-        new_edges = np.asarray(new_edges)
+        for k, vv in attributes.items():
+            if nonstring_container(vv):
+                new_attr[k] = [vv[i] for i in kept]
+            else:
+                new_attr[k] = [vv]*len(kept)
 
     return new_edges, new_attr
 
@@ -283,7 +398,45 @@ def _cleanup_edges(g, edges, attributes, duplicates, loops, existing, ignore):
 # Distance rule #
 # ------------- #
 
-def dist_rule(rule, scale, pos_src, pos_targets, dist=None):
+@lru_cache(maxsize=None)
+def _dist_kernel(rule, scale, max_proba=1., squared=False):
+    '''
+    Return the function giving the probability of an edge from its length,
+    specialized once for a given `rule`, `scale`, and `max_proba`.
+    If `squared` is True, the function takes the squared length instead,
+    which avoids computing any square root for the Gaussian rule.
+    '''
+    if rule == 'exp':
+        def kernel(dist):
+            proba = np.sqrt(dist) if squared else np.array(dist)
+            proba /= -scale
+            np.exp(proba, out=proba)
+            proba *= max_proba
+            return proba
+    elif rule == 'gaussian':
+        def kernel(dist):
+            if squared:
+                proba = np.multiply(dist, -0.5 / scale**2)
+            else:
+                proba = np.divide(dist, scale)
+                np.square(proba, out=proba)
+                proba *= -0.5
+            np.exp(proba, out=proba)
+            proba *= max_proba
+            return proba
+    elif rule == 'lin':
+        def kernel(dist):
+            proba = np.sqrt(dist) if squared else np.array(dist)
+            np.subtract(scale, proba, out=proba)
+            proba *= max_proba / scale
+            return proba.clip(min=0., out=proba)
+    else:
+        raise InvalidArgument('Unknown rule "' + rule + '".')
+
+    return kernel
+
+
+def dist_rule(rule, scale, pos_src, pos_targets, dist=None, out=None):
     '''
     DR test from one source to several targets
 
@@ -293,35 +446,28 @@ def dist_rule(rule, scale, pos_src, pos_targets, dist=None):
         Either 'exp', 'gaussian', or 'lin'.
     scale : float
         Characteristic scale.
-    pos_src : array of shape (2, N)
+    pos_src : array of shape (2, N) or pair of arrays of size N
         Positions of the sources.
-    pos_targets : array of shape (2, N)
+    pos_targets : array of shape (2, N) or pair of arrays of size N
         Positions of the targets.
     dist : list, optional (default: None)
         List that will be filled with the distances of the edges.
+    out : array of size N, optional (default: None)
+        Preallocated array where the distances of the edges will be stored.
 
     Returns
     -------
     Array of size N giving the probability of the edges according to the rule.
     '''
-    vect = pos_targets - pos_src
-    origin = np.array([(0., 0.)])
-    # todo correct this
-    dist_tmp = np.squeeze(cdist(vect.T, origin), axis=1)
+    dist_tmp = np.hypot(pos_targets[0] - pos_src[0],
+                        pos_targets[1] - pos_src[1], out=out)
     if dist is not None:
         dist.extend(dist_tmp)
-    if rule == 'exp':
-        return np.exp(np.divide(dist_tmp, -scale))
-    elif rule == 'gaussian':
-        return np.exp(-0.5*np.square(np.divide(dist_tmp, scale)))
-    elif rule == 'lin':
-        return np.divide(scale - dist_tmp, scale).clip(min=0.)
-    else:
-        raise InvalidArgument('Unknown rule "' + rule + '".')
+    return _dist_kernel(rule, scale)(dist_tmp)
 
 
 def max_proba_dist_rule(rule, scale, max_proba, pos_src, pos_targets,
-                        dist=None):
+                        dist=None, out=None):
     '''
     DR test from one source to several targets
 
@@ -333,33 +479,24 @@ def max_proba_dist_rule(rule, scale, max_proba, pos_src, pos_targets,
         Characteristic scale.
     norm : float
         Normalization factor giving proba at zero distance.
-    pos_src : 2-tuple
+    pos_src : 2-tuple of floats or of arrays of size N
         Positions of the sources.
-    pos_targets : array of shape (2, N)
+    pos_targets : array of shape (2, N) or pair of arrays of size N
         Positions of the targets.
     dist : list, optional (default: None)
         List that will be filled with the distances of the edges.
+    out : array of size N, optional (default: None)
+        Preallocated array where the distances of the edges will be stored.
 
     Returns
     -------
     Array of size N giving the probability of the edges according to the rule.
     '''
     x, y = pos_src
-    s = np.repeat([[x], [y]], pos_targets.shape[1], axis=1)
-    vect = pos_targets - np.repeat([[x], [y]], pos_targets.shape[1], axis=1)
-    origin = np.array([(0., 0.)])
-    # todo correct this
-    dist_tmp = np.squeeze(cdist(vect.T, origin), axis=1)
+    dist_tmp = np.hypot(pos_targets[0] - x, pos_targets[1] - y, out=out)
     if dist is not None:
         dist.extend(dist_tmp)
-    if rule == 'exp':
-        return max_proba*np.exp(np.divide(dist_tmp, -scale))
-    elif rule == 'gaussian':
-        return max_proba*np.exp(-0.5*np.square(np.divide(dist_tmp, scale)))
-    elif rule == 'lin':
-        return max_proba*np.divide(scale - dist_tmp, scale).clip(min=0.)
-    else:
-        raise InvalidArgument('Unknown rule "' + rule + '".')
+    return _dist_kernel(rule, scale, max_proba)(dist_tmp)
 
 
 def _set_dist_new_edges(new_attr, graph, edge_list):
@@ -369,11 +506,13 @@ def _set_dist_new_edges(new_attr, graph, edge_list):
             positions = graph.get_positions(list(edge_list[0]))
             new_attr["distance"] = cdist([positions[0]], [positions[1]])[0][0]
         else:
+            # compute only the lengths of the new edges, all at once
+            edges     = np.asarray(edge_list, dtype=int).reshape(-1, 2)
             positions = graph.get_positions()
-            mat = cdist(positions, positions)
-            distances = [mat[e[0], e[1]] for e in edge_list]
+            vectors   = positions[edges[:, 1]] - positions[edges[:, 0]]
 
-            new_attr["distance"] = distances
+            new_attr["distance"] = np.sqrt(
+                np.einsum("ij,ij->i", vectors, vectors))
 
 
 def _set_default_edge_attributes(g, attributes, num_edges):
@@ -384,13 +523,13 @@ def _set_default_edge_attributes(g, attributes, num_edges):
         if k not in attributes:
             dtype = g.get_attribute_type(k)
             if dtype == "string":
-                attributes[k] = ["" for _ in range(num_edges)]
+                attributes[k] = [""]*num_edges
             elif dtype == "double" and not skip:
-                attributes[k] = [np.NaN for _ in range(num_edges)]
+                attributes[k] = np.full(num_edges, np.NaN)
             elif dtype == "int":
-                attributes[k] = [0 for _ in range(num_edges)]
+                attributes[k] = np.zeros(num_edges, dtype=int)
             elif not skip:
-                attributes[k] = [None for _ in range(num_edges)]
+                attributes[k] = [None]*num_edges
 
 
 def _connect_ccs(g, cids, cc1, cc2, cc, c, cmean, edges, bridges,
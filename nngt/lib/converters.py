@@ -27,24 +27,22 @@ def _to_np_array(data, dtype):
 
 
 def _to_list(string):
+    ''' Split a string on its most frequent separator '''
+    # ties are resolved in the order of `separators`
     separators = (';', ',', ' ', '\t')
-    count = -np.Inf
-    chosen = -1
-    for i, delim in enumerate(separators):
-        current = string.count(delim)
-        if count < current:
-            count = current
-            chosen = separators[i]
-            break
+    chosen     = max(separators, key=string.count)
+
     return string.split(chosen)
 
 
 def _to_int(string):
-    try:
-        return int(string)
-    except ValueError:
+    # check for decimal or scientific notation rather than catching the
+    # ValueError raised by int()
+    if "." in string or "e" in string or "E" in string:
         return int(float(string))
 
+    return int(string)
+
 
 def _to_string(byte_string):
     ''' Convert bytes to string '''
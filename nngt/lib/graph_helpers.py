@@ -49,8 +49,6 @@ def _get_edge_attr(graph, elist, attribute, prop=None, last_edges=False):
     '''
     # check the weights
     if "weight" == attribute:
-        weights = np.ones(len(elist))
-
         if graph.is_weighted():
             prop = graph._w if prop is None else _edge_prop(prop)
 
@@ -61,6 +59,8 @@ def _get_edge_attr(graph, elist, attribute, prop=None, last_edges=False):
             weights = _eprop_distribution(
                 graph, prop["distribution"], elist=elist,
                 last_edges=last_edges, **params)
+        else:
+            weights = np.ones(len(elist))
 
         # if dealing with network, check inhibitory weight factor
         if graph.is_network() and not np.isclose(graph._iwf, 1.):
@@ -71,7 +71,6 @@ def _get_edge_attr(graph, elist, attribute, prop=None, last_edges=False):
 
     # also check delays
     if "delay" == attribute:
-        delays = np.ones(len(elist))
         if prop is None and hasattr(graph, "_d"):
             prop = graph._d
         elif prop is not None:
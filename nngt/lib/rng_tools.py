@@ -22,9 +22,10 @@ from .test_functions import mpi_random
 @mpi_random
 def seed(msd=None, seeds=None):
     '''
-    Seed the random generator used by NNGT
-    (i.e. the numpy `RandomState`: for details, see
-    :class:`numpy.random.RandomState`).
+    Seed the random generators used by NNGT
+    (i.e. the numpy `RandomState` and the :class:`numpy.random.Generator`
+    used by the graph generation algorithms: for details, see
+    :class:`numpy.random.RandomState` and :func:`numpy.random.default_rng`).
 
     Parameters
     ----------
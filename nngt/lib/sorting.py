@@ -8,7 +8,7 @@
 import numpy as np
 
 from .errors import InvalidArgument
-from .test_functions import nonstring_container, is_integer
+from .test_functions import nonstring_container
 
 
 def find_idx_nearest(array, values):
@@ -28,23 +28,21 @@ def find_idx_nearest(array, values):
     -------
     idx : int or array representing the index of the closest value in `array`
     '''
-    idx = np.searchsorted(array, values, side="left") # get the interval
-    # return the index of the closest
-    if isinstance(values, np.float) or is_integer(values):
-        if idx == len(array):
-            return idx-1
-        else:
-            idx -= (np.abs(values-array[idx-1]) < np.abs(values-array[idx]))
-            return idx
-    else:
-        # find where it is idx_max+1
-        overflow = (idx == len(array))
-        idx[overflow] -= 1
-        # for the others, find the nearest
-        tmp = idx[~overflow]
-        idx[~overflow] = tmp - (np.abs(values[~overflow] - array[tmp-1])
-                                < np.abs(values[~overflow] - array[tmp]))
-        return idx
+    array  = np.asarray(array)
+    values = np.asarray(values)
+
+    if len(array) == 1:
+        return np.zeros(values.shape, dtype=int)[()]
+
+    # get the interval, clipped so that both neighbours exist
+    idx = np.clip(np.searchsorted(array, values, side="left"), 1,
+                  len(array) - 1)
+
+    # return the index of the closest (values outside the range of `array`
+    # give a negative distance on their side)
+    idx -= (values - array[idx - 1]) < (array[idx] - values)
+
+    return idx
 
 
 def _sort_neurons(sort, gids, network, data=None, return_attr=False):
@@ -76,7 +74,7 @@ def _sort_neurons(sort, gids, network, data=None, return_attr=False):
     min_nest_gid = network.nest_gids.min()
     max_nest_gid = network.nest_gids.max()
 
-    sorting = np.zeros(max_nest_gid + 1)
+    sorting = np.zeros(max_nest_gid + 1, dtype=np.int64)
 
     attribute = None
     sorted_ids = None
@@ -108,12 +106,13 @@ def _sort_neurons(sort, gids, network, data=None, return_attr=False):
             # check for non-spiking neurons
             num_b2 = attribute.shape[0]
             if num_b2 < network.node_nb():
-                spikes = np.bincount(data[:, 0])
-                non_spiking = np.where(spikes[min_nest_gid:] == 0)[0]
-                sorted_ids.resize(network.node_nb())
-                for i, n in enumerate(non_spiking):
-                    sorted_ids[sorted_ids >= n] += 1
-                    sorted_ids[num_b2 + i] = n
+                spikes = np.bincount(data[:, 0].astype(int),
+                                     minlength=max_nest_gid + 1)
+                spiking = spikes[min_nest_gid:] > 0
+                # map the B2 order to node ids, non-spiking neurons last
+                sorted_ids = np.concatenate((
+                    np.flatnonzero(spiking)[sorted_ids],
+                    np.flatnonzero(~spiking)))
         elif sort == "space":
             xs, ys = network.get_positions().T
             x_min, x_max = np.min(xs), np.max(xs)
@@ -162,9 +161,9 @@ def _sort_neurons(sort, gids, network, data=None, return_attr=False):
             num_sorted += len(group.ids)
 
     if return_attr:
-        return sorting.astype(int), attribute
+        return sorting, attribute
 
-    return sorting.astype(int)
+    return sorting
 
 
 def _sort_groups(pop):
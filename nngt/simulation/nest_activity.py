@@ -546,8 +546,14 @@ def _analysis(times, senders, limits, network=None,
     }
     num_spikes, avg_rate = len(times), 0.
     if num_spikes:
-        num_neurons = (len(np.unique(senders)) if network is None
-                       else network.node_nb())
+        if network is not None:
+            num_neurons = network.node_nb()
+        elif np.asarray(senders).dtype.kind in "iu":
+            # NEST gids are small positive integers: count them without
+            # sorting
+            num_neurons = np.count_nonzero(np.bincount(senders))
+        else:
+            num_neurons = len(np.unique(senders))
         # set the studied region
         if limits[0] >= times[0]:
             idx_start = np.where(times >= limits[0])[0][0]
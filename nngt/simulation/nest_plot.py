@@ -148,6 +148,15 @@ def plot_activity(gid_recorder=None, record=None, network=None, gids=None,
 
         record = tuple("spikes" for _ in range(len(recorders)))
 
+    # query the status of all recorders at once
+    infos = ()
+
+    if len(recorders):
+        if nest_version == 3:
+            infos = nest.GetStatus(recorders)
+        else:
+            infos = nest.GetStatus(tuple(rec[0] for rec in recorders))
+
     # get gids and groups
     gids = network.nest_gids if (gids is None and network is not None) \
            else gids
@@ -155,8 +164,8 @@ def plot_activity(gid_recorder=None, record=None, network=None, gids=None,
     if gids is None:
         gids = []
 
-        for rec in recorders:
-            gids.extend(nest.GetStatus(rec)[0]["events"]["senders"])
+        for info in infos:
+            gids.extend(info["events"]["senders"])
 
         gids = np.unique(gids)
 
@@ -182,8 +191,7 @@ def plot_activity(gid_recorder=None, record=None, network=None, gids=None,
             data = None
             if sort.lower() in ("firing_rate", "b2"):  # get senders
                 data = [[], []]
-                for rec in recorders:
-                    info = nest.GetStatus(rec)[0]
+                for info in infos:
                     if str(info["model"]) == spike_rec:
                         data[0].extend(info["events"]["senders"])
                         data[1].extend(info["events"]["times"])
@@ -228,9 +236,7 @@ def plot_activity(gid_recorder=None, record=None, network=None, gids=None,
     datasets = []
     max_time = 0.
 
-    for rec in recorders:
-        info = nest.GetStatus(rec)[0]
-
+    for info in infos:
         if len(info["events"]["times"]):
             max_time = max(max_time, np.max(info["events"]["times"]))
 
@@ -291,7 +297,8 @@ def plot_activity(gid_recorder=None, record=None, network=None, gids=None,
                 if histogram:
                     axes['histogram'] = l[1].axes
         else:
-            da_time  = info["events"]["times"]
+            events   = info["events"]
+            da_time  = events["times"]
             # prepare axis setup
             fig = None
             if axis is None:
@@ -324,13 +331,13 @@ def plot_activity(gid_recorder=None, record=None, network=None, gids=None,
                             axes[-1].name = name
                 if not axes:
                     axes = _set_new_plot(fig.number, names=var)[1]
-                labels_tmp = [lbl for _ in range(len(var))]
+                labels_tmp = [lbl]*len(var)
                 for subvar, c in zip(var, m_colors):
                     c = kwargs.get('color', c)
                     alpha = kwargs.get('alpha', 1)
                     for ax in axes:
                         if ax.name == subvar:
-                            da_subvar = info["events"][subvar]
+                            da_subvar = events[subvar]
                             if isinstance(normalize, nngt.NeuralPop):
                                 da_subvar /= normalize[num_meter].size
                             elif nonstring_container(normalize):
@@ -348,7 +355,7 @@ def plot_activity(gid_recorder=None, record=None, network=None, gids=None,
                 num_axes, ax = len(fig.axes), axis
                 if axis is None:
                     ax = fig.add_subplot(num_axes + 1, 1, num_axes + 1)
-                da_var = info["events"][var]
+                da_var = events[var]
                 c = kwargs.get('color', None)
                 alpha = kwargs.get('alpha', 1)
                 lines_tmp.extend(ax.plot(da_time, da_var/normalize, color=c,
@@ -366,23 +373,7 @@ def plot_activity(gid_recorder=None, record=None, network=None, gids=None,
         if limits is not None:
             ax.set_xlim(limits[0], limits[1])
         else:
-            t_min, t_max, idx_min, idx_max = np.inf, -np.inf, np.inf, -np.inf
-
-            for l in ax.lines:
-                t_max = max(np.max(l.get_xdata()), t_max)
-                t_min = min(np.min(l.get_xdata()), t_max)
-                idx_min = min(np.min(l.get_ydata()), idx_min)
-                idx_max = max(np.max(l.get_ydata()), idx_max)
-
-            dt   = t_max - t_min
-            didx = idx_max - idx_min
-            pc   = 0.02
-
-            if not np.any(np.isinf((t_max, t_min))):
-                ax.set_xlim([t_min - pc*dt, t_max + pc*dt])
-
-            if not np.any(np.isinf((idx_min, idx_max))):
-              ax.set_ylim([idx_min - pc*didx, idx_max + pc*didx])
+            _autoscale_raster(ax)
 
     for recorder in fignums:
         fig = plt.figure(fignums[recorder])
@@ -510,13 +501,12 @@ def raster_plot(times, senders, limits=None, title="Spike raster",
                 senders = senders[keep]
 
             lines.extend(ax1.plot(
-                times, senders, c=color, marker="o", linestyle='None',
-                mec="k", mew=0.5, ms=4, **mpl_kwargs))
+                *_raster_segments(times, senders), c=color, lw=0.5,
+                **mpl_kwargs))
 
-            ax1_lines = ax1.lines
-
-            if len(ax1_lines) > 1:
-                t_max = max(ax1_lines[0].get_xdata().max(),times[-1])
+            if len(ax1.lines) > 1:
+                # the data limits are kept up to date by matplotlib
+                t_max = max(ax1.dataLim.x1, times[-1])
                 ax1.set_xlim([-delta_t, t_max+delta_t])
 
             ax1.set_ylabel(ylabel)
@@ -535,29 +525,19 @@ def raster_plot(times, senders, limits=None, title="Spike raster",
                 data = hist_lines[-1].get_data()
                 bottom = data[1]
                 if limits is None:
+                    # align the previous rate on the new times: old bin j
+                    # is new bin j + shift, bins outside the old range are 0
                     dt = fr_times[1] - fr_times[0]
-                    old_times = data[0]
-                    old_start = int(old_times[0] / dt)
-                    new_start = int(fr_times[0] / dt)
-                    old_end = int(old_times[-1] / dt)
-                    new_end = int(fr_times[-1] / dt)
-                    diff_start = new_start-old_start
-                    diff_end = new_end-old_end
-                    if diff_start > 0:
-                        bottom = bottom[diff_start:]
-                    else:
-                        bottom = np.concatenate(
-                            (np.zeros(-diff_start), bottom))
-                    if diff_end > 0:
-                        bottom = np.concatenate((bottom, np.zeros(diff_end)))
-                    else:
-                        bottom = bottom[:diff_end-1]
-                    b_len, h_len = len(bottom), len(fr)
-                    if  b_len > h_len:
-                        bottom = bottom[:h_len]
-                    elif b_len < h_len:
-                        bottom = np.concatenate(
-                            (bottom, np.zeros(h_len-b_len)))
+                    shift = int(data[0][0] / dt) - int(fr_times[0] / dt)
+
+                    lo = max(shift, 0)
+                    hi = min(shift + len(bottom), len(fr))
+
+                    old_bottom = bottom
+                    bottom = np.zeros(len(fr))
+
+                    if hi > lo:
+                        bottom[lo:hi] = old_bottom[lo - shift:hi - shift]
                 else:
                     bottom = bottom[:-1]
 
@@ -602,8 +582,8 @@ def raster_plot(times, senders, limits=None, title="Spike raster",
                             ls='None', mec='k', mew=0.5, ms=4, **mpl_kwargs))
             else:
                 lines.extend(ax.plot(
-                    times, senders, c=color, marker="o", linestyle='None',
-                    mec="k", mew=0.5, ms=4, **mpl_kwargs))
+                    *_raster_segments(times, senders), c=color, lw=0.5,
+                    **mpl_kwargs))
 
             ax.set_ylabel(ylabel)
             ax.set_xlabel(xlabel)
@@ -634,40 +614,41 @@ def raster_plot(times, senders, limits=None, title="Spike raster",
 #------------------------
 #
 
-def _fill_between_steps(x, y1, y2=0, h_align='mid'):
+def _raster_segments(times, senders):
     '''
-    Fills a hole in matplotlib: fill_between for step plots.
-
-    Parameters :
-    ------------
-    x : array-like
-        Array/vector of index values. These are assumed to be equally-spaced.
-        If not, the result will probably look weird...
-    y1 : array-like
-        Array/vector of values to be filled under.
-    y2 : array-Like
-        Array/vector or bottom values for filled area. Default is 0.
+    Represent each spike as a short vertical segment, all segments being
+    separated by NaNs so that they can be drawn as a single line (much faster
+    to render than one marker per spike).
     '''
-    # First, duplicate the x values
-    xx = np.repeat(x,2)
-    # Now: the average x binwidth
-    xstep = np.repeat((x[1:] - x[:-1]), 2)
-    xstep = np.concatenate(([xstep[0]], xstep, [xstep[-1]]))
-    # Now: add one step at end of row.
-    #~ xx = np.append(xx, xx.max() + xstep[-1])
-
-    # Make it possible to change step alignment.
-    if h_align == 'mid':
-        xx -= xstep / 2.
-    elif h_align == 'right':
-        xx -= xstep
-
-    # Also, duplicate each y coordinate in both arrays
-    y1 = np.repeat(y1,2)#[:-1]
-    if type(y2) == np.ndarray:
-        y2 = np.repeat(y2,2)#[:-1]
-
-    return xx, y1, y2
+    xs = np.repeat(np.asarray(times, dtype=float), 3)
+    ys = np.repeat(np.asarray(senders, dtype=float), 3)
+
+    ys[0::3] -= 0.4
+    ys[1::3] += 0.4
+
+    xs[2::3] = np.NaN
+    ys[2::3] = np.NaN
+
+    return xs, ys
+
+
+def _autoscale_raster(ax, pc=0.02):
+    '''
+    Set the limits of a raster axis from its data bounds, with a margin of
+    `pc` times the data range on each side.
+
+    Uses the axis data limits, which ignore the NaN separators introduced by
+    :func:`_raster_segments`.
+    '''
+    t_min, idx_min, t_max, idx_max = ax.dataLim.extents
+
+    if np.all(np.isfinite((t_min, t_max))):
+        dt = t_max - t_min
+        ax.set_xlim([t_min - pc*dt, t_max + pc*dt])
+
+    if np.all(np.isfinite((idx_min, idx_max))):
+        didx = idx_max - idx_min
+        ax.set_ylim([idx_min - pc*didx, idx_max + pc*didx])
 
 
 def _moving_average (values, window):
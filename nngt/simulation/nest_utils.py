@@ -404,27 +404,27 @@ def _monitor(gids, nest_recorder, params):
             device = None
             di_spec = {"rule": "all_to_all"}
 
+            # parameters are set on creation to save a SetStatus call
             if not params[i].get("to_accumulator", True):
-                device = nest.Create(rec, len(gids), _warn=False)
+                device = nest.Create(rec, len(gids), params=params[i],
+                                     _warn=False)
                 di_spec["rule"] = "one_to_one"
             else:
-                device = nest.Create(rec, _warn=False)
+                device = nest.Create(rec, params=params[i], _warn=False)
 
             recorders += device if nest_version == 3 else list(device)
 
             device_params = nest.GetDefaults(rec)
             device_params.update(params[i])
             new_record.append(device_params["record_from"])
-            nest.SetStatus(device, params[i], _warn=False)
             nest.Connect(device, gids, conn_spec=di_spec, _warn=False)
         # event detectors
         elif rec == spike_rec:
-            device = nest.Create(rec, _warn=False)
+            device = nest.Create(rec, params=params[i], _warn=False)
 
             recorders += device if nest_version == 3 else list(device)
 
             new_record.append("spikes")
-            nest.SetStatus(device, params[i], _warn=False)
             nest.Connect(gids, device, _warn=False)
         else:
             raise InvalidArgument('Invalid recorder item in `nest_recorder`: '
@@ -67,6 +67,21 @@ lopt =  {
     'clang': [],
 }
 
+# optional host-specific optimizations (binaries are then not portable)
+native = os.environ.get("NNGT_NATIVE", "0") == "1"
+
+native_copt = {
+    'msvc': ['/arch:AVX2', '/GL'],
+    'gcc': ['-march=native', '-mtune=native', '-flto', '-funroll-loops'],
+    'clang': ['-march=native', '-mtune=native', '-flto', '-funroll-loops'],
+}
+
+native_lopt = {
+    'msvc': ['/LTCG'],
+    'gcc': ['-flto'],
+    'clang': ['-flto'],
+}
+
 
 # check whether compiler supports a flag
 def has_flag(compiler, flagname):
@@ -112,6 +127,15 @@ class build_ext(_build_ext):
         elif "msvc" in c:
             c = "msvc"
 
+        if native:
+            if c == "msvc":
+                copt[c].extend(native_copt[c])
+                lopt.setdefault(c, []).extend(native_lopt[c])
+            elif c in native_copt and \
+                 all(has_flag(self.compiler, f) for f in native_copt[c]):
+                copt[c].extend(native_copt[c])
+                lopt[c].extend(native_lopt[c])
+
         for e in self.distribution.ext_modules:
             e.extra_link_args.extend(lopt.get(c, []))
             e.extra_compile_args.extend(copt.get(c, []))
@@ -56,15 +56,25 @@ class XmlHandler:
         self.root = tree.getroot()
         self.graphs = self.root.find("graphs")
 
+        # index tests and graphs by name once instead of searching the tree
+        # on each request
+        self._tests = {
+            elt.get("name"): elt for elt in self.root.findall("test")
+        }
+
+        self._graphs = {
+            elt.get("name"): elt for elt in self.graphs.findall("graph")
+        }
+
     def result(self, elt):
         return self.di_type[elt.tag](elt.text)
 
     def get_graph_list(self, test):
-        elt_test = self.root.find('./test[@name="{}"]'.format(test))
+        elt_test = self._tests[test]
         return [ child.text for child in elt_test.find("graph_list") ]
 
     def get_graph_options(self, graph):
-        graph_elt = self.graphs.find('./graph[@name="{}"]'.format(graph))
+        graph_elt = self._graphs[graph]
         elt_options = None
         for child in graph_elt:
             if child.tag in ("load_options", "generate_options"):
@@ -76,7 +86,7 @@ class XmlHandler:
         return {}
 
     def get_result(self, graph, result_name):
-        elt_test = self.graphs.find('./graph[@name="{}"]'.format(graph))
+        elt_test = self._graphs[graph]
         elt_result = elt_test.find('./*[@name="{}"]'.format(result_name))
         return self.result(elt_result)
 
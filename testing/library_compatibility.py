@@ -72,18 +72,18 @@ def test_weighted_undirected_clustering():
         g.new_edges(edge_list, attributes={"weight": weights})
 
         # onnela
-        assert np.all(np.isclose(
+        assert np.allclose(
             na.local_clustering(g, weights="weight", method="onnela"),
-            onnela))
+            onnela)
 
         assert np.isclose(
             na.global_clustering(g, weights="weight", method="onnela"),
             gc_onnela)
 
         # barrat
-        assert np.all(np.isclose(
+        assert np.allclose(
             na.local_clustering(g, weights="weight", method="barrat"),
-            barrat))
+            barrat)
 
         assert np.isclose(
             na.global_clustering(g, weights="weight", method="barrat"),
@@ -97,17 +97,17 @@ def test_weighted_undirected_clustering():
         g.new_edges(np.array(edge_list, dtype=int)[:, ::-1],
                     attributes={"weight": weights})
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             na.local_clustering(g, weights="weight", method="onnela"),
-            onnela))
+            onnela)
 
         assert np.isclose(
             na.global_clustering(g, weights="weight", method="onnela"),
             gc_onnela)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             na.local_clustering(g, weights="weight", method="barrat"),
-            barrat))
+            barrat)
 
         assert np.isclose(
             na.global_clustering(g, weights="weight", method="barrat"),
@@ -179,12 +179,12 @@ def test_closeness():
         g = nngt.Graph(nodes=num_nodes, directed=True)
         g.new_edges(edge_list, attributes={"weight": weights})
 
-        assert np.all(np.isclose(
-            nngt.analyze_graph["closeness"](g, harmonic=False), expected))
+        assert np.allclose(
+            nngt.analyze_graph["closeness"](g, harmonic=False), expected)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, weights=True, harmonic=False),
-            weighted))
+            weighted)
 
     # with zero degrees and harmonic implementation
     # closeness does not work for igraph if some nodes have zero in/out-degrees
@@ -206,28 +206,28 @@ def test_closeness():
         g = nngt.Graph(nodes=num_nodes, directed=True)
         g.new_edges(edge_list, attributes={"weight": weights})
 
-        assert np.all(np.isclose(
-            nngt.analyze_graph["closeness"](g, harmonic=True), harmonic))
+        assert np.allclose(
+            nngt.analyze_graph["closeness"](g, harmonic=True), harmonic)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, harmonic=False), arithmetic,
-            equal_nan=True))
+            equal_nan=True)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, mode="in", harmonic=True),
-            harmonic_in))
+            harmonic_in)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, mode="in", harmonic=False),
-            arithmetic_in, equal_nan=True))
+            arithmetic_in, equal_nan=True)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, weights=True, harmonic=True),
-            harmonic_wght))
+            harmonic_wght)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, weights=True, harmonic=False),
-            arithmetic_wght, equal_nan=True))
+            arithmetic_wght, equal_nan=True)
 
     # UNDIRECTED
     harmonic   = [7/8, 3/4, 7/8, 1., 3/4]
@@ -242,21 +242,21 @@ def test_closeness():
         g = nngt.Graph(nodes=num_nodes, directed=False)
         g.new_edges(edge_list, attributes={"weight": weights})
 
-        assert np.all(np.isclose(
-            nngt.analyze_graph["closeness"](g, harmonic=True), harmonic))
+        assert np.allclose(
+            nngt.analyze_graph["closeness"](g, harmonic=True), harmonic)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, weights=True, harmonic=True),
-            harmonic_wght))
+            harmonic_wght)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, harmonic=False), arithmetic,
-            equal_nan=True))
+            equal_nan=True)
 
-        assert np.all(np.isclose(
+        assert np.allclose(
             nngt.analyze_graph["closeness"](g, weights="weight",
                                             harmonic=False),
-            arithmetic_wght, equal_nan=True))
+            arithmetic_wght, equal_nan=True)
 
 
 def test_betweenness():
@@ -282,14 +282,14 @@ def test_betweenness():
 
         nb, eb = nngt.analyze_graph["betweenness"](g)
 
-        assert np.all(np.isclose(nb, nb_expect))
-        assert np.all(np.isclose(eb, eb_expect))
+        assert np.allclose(nb, nb_expect)
+        assert np.allclose(eb, eb_expect)
 
         # weighted
         nb, eb = nngt.analyze_graph["betweenness"](g, weights=True)
 
-        assert np.all(np.isclose(nb, nb_exp_wght))
-        assert np.all(np.isclose(eb, eb_exp_wght))
+        assert np.allclose(nb, nb_exp_wght)
+        assert np.allclose(eb, eb_exp_wght)
 
     # DIRECTED
     edge_list  = [
@@ -312,14 +312,14 @@ def test_betweenness():
 
         nb, eb = nngt.analyze_graph["betweenness"](g)
 
-        assert np.all(np.isclose(nb, nb_expect))
-        assert np.all(np.isclose(eb, eb_expect))
+        assert np.allclose(nb, nb_expect)
+        assert np.allclose(eb, eb_expect)
 
         # weighted
         nb, eb = nngt.analyze_graph["betweenness"](g, weights=True)
 
-        assert np.all(np.isclose(nb, nb_exp_wght))
-        assert np.all(np.isclose(eb, eb_exp_wght))
+        assert np.allclose(nb, nb_exp_wght)
+        assert np.allclose(eb, eb_exp_wght)
 
 
 def test_components():
@@ -765,19 +765,19 @@ def test_subgraph_centrality():
     sc_nngt = nngt.analysis.subgraph_centrality(g, weights=False,
                                                 normalize=False)
 
-    assert np.all(np.isclose(sc_nx, sc_nngt))
+    assert np.allclose(sc_nx, sc_nngt)
 
     # test max_centrality
     sc_nngt = nngt.analysis.subgraph_centrality(g, weights=False,
                                                 normalize="max_centrality")
 
-    assert np.all(np.isclose(sc_nx / sc_nx.max(), sc_nngt))
+    assert np.allclose(sc_nx / sc_nx.max(), sc_nngt)
 
     # test subpart
     sc_nngt = nngt.analysis.subgraph_centrality(g, weights=False,
                                                 normalize=False, nodes=[0, 1])
 
-    assert np.all(np.isclose(sc_nx[:2], sc_nngt))
+    assert np.allclose(sc_nx[:2], sc_nngt)
 
 
 if __name__ == "__main__":
@@ -45,15 +45,15 @@ def test_binary_undirected_clustering():
     g.new_edges(edge_list)
 
     # check all 3 ways of computing the local clustering
-    assert np.all(np.isclose(
-        na.local_clustering_binary_undirected(g), loc_clst))
+    assert np.allclose(
+        na.local_clustering_binary_undirected(g), loc_clst)
 
-    assert np.all(np.isclose(
-        na.local_clustering(g, directed=False), loc_clst))
+    assert np.allclose(
+        na.local_clustering(g, directed=False), loc_clst)
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         nngt.analyze_graph["local_clustering"](g, directed=False),
-        loc_clst))
+        loc_clst)
 
     # check all 4 ways of computing the global clustering
     assert np.isclose(
@@ -71,8 +71,8 @@ def test_binary_undirected_clustering():
     # check that self-loops are ignore
     g.new_edge(0, 0, self_loop=True)
 
-    assert np.all(np.isclose(
-        na.local_clustering_binary_undirected(g), loc_clst))
+    assert np.allclose(
+        na.local_clustering_binary_undirected(g), loc_clst)
 
     assert np.isclose(
         na.global_clustering_binary_undirected(g), glob_clst)
@@ -83,7 +83,7 @@ def test_binary_undirected_clustering():
     ccu = na.local_clustering_binary_undirected(g)
     cc  = na.local_clustering(g)
 
-    assert np.all(np.isclose(cc, ccu))
+    assert np.allclose(cc, ccu)
 
 
 @pytest.mark.mpi_skip
@@ -106,7 +106,7 @@ def test_weighted_undirected_clustering():
     for method in methods:
         ccw = na.local_clustering(g, weights='weight', method=method)
 
-        assert np.all(np.isclose(ccb, ccw))
+        assert np.allclose(ccb, ccw)
 
     # corner cases
     eps = 1e-15
@@ -132,11 +132,11 @@ def test_weighted_undirected_clustering():
         cc = na.local_clustering(g, weights='weight', method=method)
 
         if method == "barrat":
-            assert np.all(np.isclose(cc, 1))
+            assert np.allclose(cc, 1)
         elif method == "zhang":
-            assert np.all(np.isclose(cc, [0, 1, 0]))
+            assert np.allclose(cc, [0, 1, 0])
         else:
-            assert np.all(np.isclose(cc, 0, atol=1e-4))
+            assert np.allclose(cc, 0, atol=1e-4)
 
     # two weights are one
     g.set_weights(np.array([eps, 1, 1]))
@@ -145,12 +145,12 @@ def test_weighted_undirected_clustering():
         cc = na.local_clustering(g, weights='weight', method=method)
 
         if method == "barrat":
-            assert np.all(np.isclose(cc, 1))
+            assert np.allclose(cc, 1)
         elif method == "zhang":
             # due to floating point rounding errors, we get 0.9 instead of 1
-            assert np.all(np.isclose(cc, (0.9, 0.9, 0), atol=1e-3))
+            assert np.allclose(cc, (0.9, 0.9, 0), atol=1e-3)
         else:
-            assert np.all(np.isclose(cc, 0, atol=1e-2))
+            assert np.allclose(cc, 0, atol=1e-2)
 
     # 4 nodes
     num_nodes = 4
@@ -166,11 +166,11 @@ def test_weighted_undirected_clustering():
         cc = na.local_clustering(g, weights='weight', method=method)
 
         if method == 'barrat':
-            assert np.all(np.isclose(cc, [1, 1, 0.5, 0]))
+            assert np.allclose(cc, [1, 1, 0.5, 0])
         elif method in ("continuous", "zhang"):
-            assert np.all(np.isclose(cc, [1, 1, 1, 0]))
+            assert np.allclose(cc, [1, 1, 1, 0])
         else:
-            assert np.all(np.isclose(cc, [1, 1, 1/3, 0]))
+            assert np.allclose(cc, [1, 1, 1/3, 0])
 
     # out of triangle edge is 1 others are epsilon
     g.set_weights([eps, eps, eps, 1])
@@ -179,9 +179,9 @@ def test_weighted_undirected_clustering():
         cc = na.local_clustering(g, weights='weight', method=method)
 
         if method == 'barrat':
-            assert np.all(np.isclose(cc, [1, 1, 0, 0]))
+            assert np.allclose(cc, [1, 1, 0, 0])
         else:
-            assert np.all(np.isclose(cc, 0))
+            assert np.allclose(cc, 0)
 
     # opposite triangle edge is 1 others are epsilon
     g.set_weights([1, eps, eps, eps])
@@ -190,11 +190,11 @@ def test_weighted_undirected_clustering():
         cc = na.local_clustering(g, weights='weight', method=method)
 
         if method == 'barrat':
-            assert np.all(np.isclose(cc, [1, 1, 1/3, 0]))
+            assert np.allclose(cc, [1, 1, 1/3, 0])
         elif method == "zhang":
-            assert np.all(np.isclose(cc, [0, 0, 1/3, 0]))
+            assert np.allclose(cc, [0, 0, 1/3, 0])
         else:
-            assert np.all(np.isclose(cc, 0, atol=1e-5))
+            assert np.allclose(cc, 0, atol=1e-5)
 
     # adjacent triangle edge is 1 others are epsilon
     g.set_weights([eps, 1, eps, eps])
@@ -203,11 +203,11 @@ def test_weighted_undirected_clustering():
         cc = na.local_clustering(g, weights='weight', method=method)
 
         if method == 'barrat':
-            assert np.all(np.isclose(cc, [1, 1, 1/2, 0]))
+            assert np.allclose(cc, [1, 1, 1/2, 0])
         elif method == "zhang":
-            assert np.all(np.isclose(cc, [1, 0, 0, 0]))
+            assert np.allclose(cc, [1, 0, 0, 0])
         else:
-            assert np.all(np.isclose(cc, 0, atol=1e-4))
+            assert np.allclose(cc, 0, atol=1e-4)
 
     # check zero-weight edge/no edge equivalence for continuous method
     num_nodes = 6
@@ -224,7 +224,7 @@ def test_weighted_undirected_clustering():
 
     cc = na.local_clustering(g, weights='weight', method='continuous')
 
-    assert np.all(np.isclose(cc, expected))
+    assert np.allclose(cc, expected)
 
     # 0-weight case
     g.set_weights([1/64, 1/729, 1/64, 0, 1])
@@ -242,8 +242,8 @@ def test_weighted_undirected_clustering():
 
     ccn = na.local_clustering(g, weights='weight', method='continuous')
 
-    assert np.all(np.isclose(cc0, ccn))
-    assert np.all(np.isclose(cc0, expected))
+    assert np.allclose(cc0, ccn)
+    assert np.allclose(cc0, expected)
 
 
 @pytest.mark.mpi_skip
@@ -265,20 +265,20 @@ def test_weighted_directed_clustering():
     triangles_c = np.array([97/839808, 97/839808, 97/839808, 0, 0, 0])
     triplets_c  = np.array([35/432, 1/54, 13/486, 0, 0, 0])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         triangles_c,
-        na.triangle_count(g, weights='weight', method='continuous')))
+        na.triangle_count(g, weights='weight', method='continuous'))
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         triplets_c,
-        na.triplet_count(g, weights='weight', method='continuous')))
+        na.triplet_count(g, weights='weight', method='continuous'))
 
     triplets_c[-3:] = 1
     expected = triangles_c / triplets_c
 
     cc = na.local_clustering(g, weights='weight', method='continuous')
 
-    assert np.all(np.isclose(cc, expected))
+    assert np.allclose(cc, expected)
 
     # barrat (clemente version for reciprocal strength)
     g.set_weights([1/4, 1/9, 1/4, 1/9, 1/4, 1/9, 1])
@@ -289,18 +289,18 @@ def test_weighted_directed_clustering():
     triangles_b = np.array([31/36, 13/18, 7/12, 0, 0, 0])
     triplets_b  = np.array([31/18, 13/18, 25/18, 0, 0, 0])
 
-    assert np.all(np.isclose(
-        triangles_b, na.triangle_count(g, weights='weight', method='barrat')))
+    assert np.allclose(
+        triangles_b, na.triangle_count(g, weights='weight', method='barrat'))
 
-    assert np.all(np.isclose(
-        triplets_b, na.triplet_count(g, weights='weight', method='barrat')))
+    assert np.allclose(
+        triplets_b, na.triplet_count(g, weights='weight', method='barrat'))
 
     triplets_b[-3:] = 1
     expected = triangles_b / triplets_b
 
     cc = na.local_clustering(g, weights='weight', method='barrat')
 
-    assert np.all(np.isclose(cc, expected))
+    assert np.allclose(cc, expected)
 
     # onnela
     triplets_o  = np.array([8, 4, 10, 0, 0, 0])
@@ -310,15 +310,15 @@ def test_weighted_directed_clustering():
     assert np.array_equal(
         triplets_o, na.triplet_count(g, weights='weight', method='onnela'))
 
-    assert np.all(np.isclose(
-        triangles_o, na.triangle_count(g, weights='weight', method="onnela")))
+    assert np.allclose(
+        triangles_o, na.triangle_count(g, weights='weight', method="onnela"))
     
     triplets_o[-3:] = 1
     expected = triangles_o / triplets_o
 
     cc = na.local_clustering(g, weights='weight', method='onnela')
 
-    assert np.all(np.isclose(cc, expected))
+    assert np.allclose(cc, expected)
 
     # zhang
     g.set_weights([1/2, 1/3, 1/2, 1/3, 1/2, 1/3, 1])
@@ -326,18 +326,18 @@ def test_weighted_directed_clustering():
     triangles_z = np.array([5/18, 5/18, 5/18, 0, 0, 0])
     triplets_z  = np.array([5/3, 2/3, 4/3, 0, 0, 0])
 
-    assert np.all(np.isclose(
-        triplets_z, na.triplet_count(g, weights='weight', method='zhang')))
+    assert np.allclose(
+        triplets_z, na.triplet_count(g, weights='weight', method='zhang'))
 
-    assert np.all(np.isclose(
-        triangles_z, na.triangle_count(g, weights='weight', method="zhang")))
+    assert np.allclose(
+        triangles_z, na.triangle_count(g, weights='weight', method="zhang"))
     
     triplets_z[-3:] = 1
     expected = triangles_z / triplets_z
 
     cc = na.local_clustering(g, weights='weight', method='zhang')
 
-    assert np.all(np.isclose(cc, expected))
+    assert np.allclose(cc, expected)
 
 
 @pytest.mark.mpi_skip
@@ -359,7 +359,7 @@ def test_clustering_parameters():
             cc_wu = na.local_clustering(g, directed=False, weights=True,
                                         combine_weights=combine, method=m)
 
-            assert np.all(np.isclose(cc_wu, cc_bu))
+            assert np.allclose(cc_wu, cc_bu)
 
         # subset of nodes
         nodes = [1, [1, 2]]
@@ -367,11 +367,11 @@ def test_clustering_parameters():
         for n in nodes:
             cc = na.local_clustering_binary_undirected(g, nodes=n)
 
-            assert np.all(np.isclose(cc, cc_bu[n]))
+            assert np.allclose(cc, cc_bu[n])
 
             cc = na.local_clustering(g, nodes=n, method=m)
 
-            assert np.all(np.isclose(cc, cc_bu[n]))
+            assert np.allclose(cc, cc_bu[n])
 
     # check different but equivalent matrices
     for m in methods:
@@ -398,7 +398,7 @@ def test_clustering_parameters():
 
         cc_sym = na.local_clustering(g, weights="weight", method=m)
 
-        assert np.all(np.isclose(cc_sum, cc_sym))
+        assert np.allclose(cc_sum, cc_sym)
 
         # subset of nodes
         nodes = [1, [1, 2]]
@@ -408,7 +408,7 @@ def test_clustering_parameters():
         for n in nodes:
             cc = na.local_clustering(g, nodes=n, weights="weight", method=m)
 
-            assert np.all(np.isclose(cc, cc_dir[n]))
+            assert np.allclose(cc, cc_dir[n])
 
 
 @pytest.mark.mpi_skip
@@ -490,18 +490,18 @@ def test_partial_directed_clustering():
     # weighted (barrat)
     g.set_weights([1, 0.5, 0.4, 1, 0.6, 1])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="fan-out", weights="weight",
                             method="barrat"),
-        [0, 1.45/3.8, 0, 0]))
+        [0, 1.45/3.8, 0, 0])
 
     assert np.array_equal(
         na.local_clustering(g, mode="fan-in", weights="weight",
                             method="barrat"), [0, 0, 0.5, 0.5])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="cycle", weights="weight", method="barrat"),
-        [0, 0.8/1.35, 1, 0.5]))
+        [0, 0.8/1.35, 1, 0.5])
 
     assert np.array_equal(
         na.local_clustering(g, mode="middleman", weights="weight",
@@ -518,9 +518,9 @@ def test_partial_directed_clustering():
         na.local_clustering(g, mode="cycle", weights="weight", method="onnela"),
         [0, 0.25, 0.5, 0.25])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="fan-out", weights="weight",
-                            method="onnela"), [0, 1/6, 0, 0]))
+                            method="onnela"), [0, 1/6, 0, 0])
 
     assert np.array_equal(
         na.local_clustering(g, mode="fan-in", weights="weight",
@@ -529,40 +529,40 @@ def test_partial_directed_clustering():
     # weighted (continuous)
     g.set_weights([1, 1/64, 1/64, 1, 1, 1])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="fan-out", weights="weight"),
-        [0, 4/17, 0, 0]))
+        [0, 4/17, 0, 0])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="fan-in", weights="weight"),
-        [0, 0, 0.25, 1/32]))
+        [0, 0, 0.25, 1/32])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="cycle", weights="weight"),
-        [0, 8/9, 1, 0.5]))
+        [0, 8/9, 1, 0.5])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="middleman", weights="weight"),
-        [0.5, 0, 0, 1/32]))
+        [0.5, 0, 0, 1/32])
 
     # weighted (zhang)
     g.set_weights([1, 0.25, 0.5, 1, 1, 0.5])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="fan-out", weights="weight", method="zhang"),
-        [0, 2/7, 0, 0]))
+        [0, 2/7, 0, 0])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="fan-in", weights="weight", method="zhang"),
-        [0, 0, 0.5, 0.125]))
+        [0, 0, 0.5, 0.125])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="cycle", weights="weight", method="zhang"),
-        [0, 2/5, 1, 0.5]))
+        [0, 2/5, 1, 0.5])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_clustering(g, mode="middleman", weights="weight", method="zhang"),
-        [1, 0, 0, 0.25]))
+        [1, 0, 0, 0.25])
 
 
 @pytest.mark.mpi_skip
@@ -707,28 +707,28 @@ def test_local_closure():
 
     g.new_edges([(0, 1), (0, 3), (1, 2), (1, 3)])
 
-    assert np.all(np.isclose(na.local_closure(g), [2/3, 1, 0, 2/3]))
+    assert np.allclose(na.local_closure(g), [2/3, 1, 0, 2/3])
 
     # undirected weighted (normal/zhang)
     g.set_weights([1, 0.5, 0.25, 1])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_closure(g, weights="weight"),
-        [4/7, 1, 0, 4/7]))
+        [4/7, 1, 0, 4/7])
 
     # check weight normalization
     g.set_weights(2*np.array([1, 0.5, 0.25, 1]))
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_closure(g, weights="weight"),
-        [4/7, 1, 0, 4/7]))
+        [4/7, 1, 0, 4/7])
 
     # undirected weighted (continuous)
     g.set_weights([1, 1/64, 1/4, 1])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         na.local_closure(g, weights="weight", method="continuous"),
-        [1/13, 0.5, 0, 1/13]))
+        [1/13, 0.5, 0, 1/13])
 
     # directed (circle)
     g = nngt.Graph(3)
@@ -771,8 +771,8 @@ def test_local_closure():
     clsrs = [[1/3, 1, 0, 1/3], [1, 0.5, 0, 2/5], [0, 1, 0, 0], [0, 0, 0, 2/3]]
 
     for mode, res in zip(modes, clsrs):
-        assert np.all(np.isclose(
-            na.local_closure(g, weights="weight", mode=mode), res))
+        assert np.allclose(
+            na.local_closure(g, weights="weight", mode=mode), res)
 
     # weights for continuous
     g.set_weights([1, 0.25, 1, 0.25, 1/64, 1])
@@ -785,10 +785,10 @@ def test_local_closure():
     ]
     
     for mode, res in zip(modes, clsrs):
-        assert np.all(np.isclose(
+        assert np.allclose(
             na.local_closure(g, weights="weight", method="continuous",
                              mode=mode),
-            res))
+            res)
 
 
 if __name__ == "__main__":
@@ -122,8 +122,8 @@ class TestAttributes(TestBasis):
         isnan2     = np.isnan(double_res)
         self.assertTrue(np.all(isnan1 == isnan2))
         self.assertTrue(
-            np.all(np.isclose(
-                g2.node_attributes['size'][~isnan1], double_res[~isnan2]))
+            np.allclose(
+                g2.node_attributes['size'][~isnan1], double_res[~isnan2])
         )
         # for the others, just compare the lists
         self.assertEqual(
@@ -366,7 +366,7 @@ def test_delays():
 
     delays = g.get_delays()
 
-    assert np.all(np.isclose(delays, dmin + slope*distances))
+    assert np.allclose(delays, dmin + slope*distances)
 
 
 @pytest.mark.mpi_skip
@@ -384,24 +384,24 @@ def test_attributes_are_copied():
     # check weights
     ww = g.get_weights()
 
-    assert np.all(np.isclose(wghts, ww))
+    assert np.allclose(wghts, ww)
 
     rng.shuffle(ww)
 
-    assert np.all(np.isclose(wghts, g.get_weights()))
-    assert not np.all(np.isclose(ww, g.get_weights()))
+    assert np.allclose(wghts, g.get_weights())
+    assert not np.allclose(ww, g.get_weights())
 
     # check edge attribute
     g.new_edge_attribute("etest", "double", values=2*ww)
 
     etest = g.edge_attributes["etest"]
 
-    assert np.all(np.isclose(etest, 2*ww))
+    assert np.allclose(etest, 2*ww)
 
     rng.shuffle(etest)
 
-    assert np.all(np.isclose(2*ww, g.edge_attributes["etest"]))
-    assert not np.all(np.isclose(2*ww, etest))
+    assert np.allclose(2*ww, g.edge_attributes["etest"])
+    assert not np.allclose(2*ww, etest)
 
     # check node attribute
     vv = rng.uniform(2, 3, nnodes)
@@ -410,12 +410,12 @@ def test_attributes_are_copied():
 
     ntest = g.node_attributes["ntest"]
 
-    assert np.all(np.isclose(ntest, vv))
+    assert np.allclose(ntest, vv)
 
     rng.shuffle(ntest)
 
-    assert np.all(np.isclose(vv, g.node_attributes["ntest"]))
-    assert not np.all(np.isclose(vv, ntest))
+    assert np.allclose(vv, g.node_attributes["ntest"])
+    assert not np.allclose(vv, ntest)
 
 
 @pytest.mark.mpi_skip
@@ -277,7 +277,7 @@ def test_new_node_attr():
 
     n = g.new_node(positions=[(0, 0)])
 
-    assert np.all(np.isclose(g.get_positions(n), (0, 0), tolerance)), \
+    assert np.allclose(g.get_positions(n), (0, 0), tolerance), \
         "Error on '{}': last position is ({}, {}) vs (0, 0) expected.".format(
             g.name, *g.get_positions(n))
 
@@ -384,7 +384,7 @@ def test_degrees_neighbors():
         np.isclose(g.get_degrees(mode="in", weights=True), in_strengths))
     assert np.all(
         np.isclose(g.get_degrees(mode="out", weights=True), out_strengths))
-    assert np.all(np.isclose(g.get_degrees(weights="weight"), tot_strengths))
+    assert np.allclose(g.get_degrees(weights="weight"), tot_strengths)
 
     assert g.neighbours(3, "in")  == {0, 1}
     assert g.neighbours(3, "out") == {2, 4}
@@ -402,7 +402,7 @@ def test_degrees_neighbors():
         np.isclose(g.get_degrees(mode="in", weights=True), tot_strengths))
     assert np.all(
         np.isclose(g.get_degrees(mode="out", weights=True), tot_strengths))
-    assert np.all(np.isclose(g.get_degrees(weights="weight"), tot_strengths))
+    assert np.allclose(g.get_degrees(weights="weight"), tot_strengths)
 
     assert g.neighbours(3, "in")  == {0, 1, 2, 4}
     assert g.neighbours(3, "out") == {0, 1, 2, 4}
@@ -428,8 +428,8 @@ def test_directed_adjacency():
         [0, 0, 1, 0, 0]
     ])
 
-    assert np.all(np.isclose(g.adjacency_matrix(weights=False).todense(),
-                             adj_mat))
+    assert np.allclose(g.adjacency_matrix(weights=False).todense(),
+                       adj_mat)
 
     w_mat = np.array([
         [0,       0.54881, 0,       0.71518, 0      ],
@@ -439,8 +439,8 @@ def test_directed_adjacency():
         [0,       0,       0.43758, 0,       0]
     ])
 
-    assert np.all(np.isclose(g.adjacency_matrix(weights=True).todense(),
-                             w_mat))
+    assert np.allclose(g.adjacency_matrix(weights=True).todense(),
+                       w_mat)
 
     # for typed edges
     tpd_mat = np.array([
@@ -451,8 +451,8 @@ def test_directed_adjacency():
         [ 0,  0,  1, 0, 0]
     ])
 
-    assert np.all(np.isclose(g.adjacency_matrix(types=True).todense(),
-                             tpd_mat))
+    assert np.allclose(g.adjacency_matrix(types=True).todense(),
+                       tpd_mat)
 
     wt_mat = np.array([
         [ 0,       -0.54881,  0,       0.71518, 0      ],
@@ -462,8 +462,8 @@ def test_directed_adjacency():
         [ 0,        0,        0.43758, 0,       0]
     ])
 
-    assert np.all(np.isclose(
-        g.adjacency_matrix(types=True, weights=True).todense(), wt_mat))
+    assert np.allclose(
+        g.adjacency_matrix(types=True, weights=True).todense(), wt_mat)
 
     # for Network and node attribute type
     num_nodes = 5
@@ -489,11 +489,11 @@ def test_directed_adjacency():
         [ 0,  0, -1,  0, 0]
     ])
 
-    assert np.all(np.isclose(net.adjacency_matrix(types=True).todense(),
-                             tpd_mat))
+    assert np.allclose(net.adjacency_matrix(types=True).todense(),
+                       tpd_mat)
 
-    assert np.all(np.isclose(g.adjacency_matrix(types=True).todense(),
-                             tpd_mat))
+    assert np.allclose(g.adjacency_matrix(types=True).todense(),
+                       tpd_mat)
 
     wt_mat = np.array([
         [ 0,       -0.54881,  0,       -0.71518, 0      ],
@@ -503,11 +503,11 @@ def test_directed_adjacency():
         [ 0,        0,       -0.43758,  0,       0]
     ])
 
-    assert np.all(np.isclose(
-        net.adjacency_matrix(types=True, weights=True).todense(), wt_mat))
+    assert np.allclose(
+        net.adjacency_matrix(types=True, weights=True).todense(), wt_mat)
 
-    assert np.all(np.isclose(
-        g.adjacency_matrix(types=True, weights=True).todense(), wt_mat))
+    assert np.allclose(
+        g.adjacency_matrix(types=True, weights=True).todense(), wt_mat)
 
 
 def test_undirected_adjacency():
@@ -529,8 +529,8 @@ def test_undirected_adjacency():
         [0, 0, 1, 1, 0]
     ])
 
-    assert np.all(np.isclose(g.adjacency_matrix(weights=False).todense(),
-                             adj_mat))
+    assert np.allclose(g.adjacency_matrix(weights=False).todense(),
+                       adj_mat)
 
     w_mat = np.array([
         [0,       0.54881, 0.54488, 0.71518, 0      ],
@@ -540,8 +540,8 @@ def test_undirected_adjacency():
         [0,       0,       0.43758, 0.64589, 0      ]
     ])
 
-    assert np.all(np.isclose(g.adjacency_matrix(weights=True).todense(),
-                             w_mat))
+    assert np.allclose(g.adjacency_matrix(weights=True).todense(),
+                       w_mat)
 
     # for typed edges
     tpd_mat = np.array([
@@ -552,8 +552,8 @@ def test_undirected_adjacency():
         [ 0,  0,  1,  1, 0]
     ])
 
-    assert np.all(np.isclose(g.adjacency_matrix(types=True).todense(),
-                             tpd_mat))
+    assert np.allclose(g.adjacency_matrix(types=True).todense(),
+                       tpd_mat)
 
     wt_mat = np.array([
         [ 0,       -0.54881, -0.54488,  0.71518, 0      ],
@@ -563,8 +563,8 @@ def test_undirected_adjacency():
         [ 0,        0,        0.43758,  0.64589, 0      ]
     ])
 
-    assert np.all(np.isclose(
-        g.adjacency_matrix(types=True, weights=True).todense(), wt_mat))
+    assert np.allclose(
+        g.adjacency_matrix(types=True, weights=True).todense(), wt_mat)
 
 
 @pytest.mark.mpi_skip
@@ -661,7 +661,7 @@ def test_delete():
 
     adj = g.adjacency_matrix(weights=True, mformat="dense")
 
-    assert np.all(np.isclose(mat, adj))
+    assert np.allclose(mat, adj)
 
     # delete several edges (eids = (3, 6))
     edges = [(1, 4), (3, 1)]
@@ -687,7 +687,7 @@ def test_delete():
 
     adj = g.adjacency_matrix(weights=True, mformat="dense")
 
-    assert np.all(np.isclose(mat, adj))
+    assert np.allclose(mat, adj)
 
     # deleting one node
     g.delete_nodes([0])
@@ -734,8 +734,8 @@ def test_delete():
 
     assert np.array_equal(g.edges_array, [(1, 2), (2, 0), (1, 4), (4, 3)])
 
-    assert np.all(np.isclose(
-        g.get_weights(), [0.5, 0.1, 1., 1.], equal_nan=True))
+    assert np.allclose(
+        g.get_weights(), [0.5, 0.1, 1., 1.], equal_nan=True)
 
     # test delete from get_edges (issue #136)
     edges = g.get_edges()
@@ -745,9 +745,9 @@ def test_delete():
     # test copy after edge deletion
     h = g.copy()
 
-    assert np.all(np.isclose(h.get_weights(), g.get_weights()))
-    assert np.all(np.isclose(h.edge_attributes["distance"],
-                             g.edge_attributes["distance"]))
+    assert np.allclose(h.get_weights(), g.get_weights())
+    assert np.allclose(h.edge_attributes["distance"],
+                       g.edge_attributes["distance"])
 
 
 def test_to_undirected():
@@ -775,9 +775,9 @@ def test_to_undirected():
 
     assert set(u.edge_attributes) == {"weight", "rnd"}
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         mat + mat.T, u.adjacency_matrix(weights="weight").todense()
-    ))
+    )
 
     assert np.array_equal(u.edge_attributes["rnd"], [2, 10, 8, 3, 14])
 
@@ -790,9 +790,9 @@ def test_to_undirected():
 
     m = np.maximum(mat, mat.T)
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         m, u.adjacency_matrix(weights="weight").todense()
-    ))
+    )
 
     assert np.array_equal(u.edge_attributes["rnd"], [2, 6, 8, 3, 9])
 
@@ -807,9 +807,9 @@ def test_to_undirected():
     m   = mat + mat.T
     m[nnz] = np.minimum(mat[nnz], mat.T[nnz])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         m, u.adjacency_matrix(weights="weight").todense()
-    ))
+    )
 
     assert np.array_equal(u.edge_attributes["rnd"], [2, 4, 8, 3, 5])
 
@@ -820,18 +820,18 @@ def test_to_undirected():
     m   = mat + mat.T
     m[nnz] = 0.5*(mat[nnz] + mat.T[nnz])
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         m, u.adjacency_matrix(weights="weight").todense()
-    ))
+    )
 
     assert np.array_equal(u.edge_attributes["rnd"], [2, 5, 8, 3, 7])
 
     # undirected mean/max
     u = g.to_undirected({"weight": "mean", "rnd": "max"})
 
-    assert np.all(np.isclose(
+    assert np.allclose(
         m, u.adjacency_matrix(weights="weight").todense()
-    ))
+    )
 
     assert np.array_equal(u.edge_attributes["rnd"], [2, 6, 8, 3, 9])
 
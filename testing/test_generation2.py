@@ -75,6 +75,14 @@ def test_from_degree_list():
         # non-graphical sequence was provided
         print("Skipping non graphical sequence for undirected graph.")
 
+    # existing edges with nodes outside of the sources and targets
+    from nngt.generation.connect_algorithms import _from_degree_list
+
+    edges = _from_degree_list([0, 1], [0, 1], [0, 1], degree_type="out",
+                              existing_edges=np.array([(0, 2)]))
+
+    assert np.array_equal(edges, [(1, 0)])
+
 
 @pytest.mark.mpi_skip
 def test_newman_watts():
@@ -371,6 +379,18 @@ def test_distances():
     assert np.array_equal(dist, expected)
     assert np.all(dist < 3)
 
+    # stored distances are exact even if edges are drawn in single precision
+    g = ng.distance_rule(20, shape=nngt.geometry.Shape.disk(100), nodes=200,
+                         avg_deg=5)
+
+    dist = g.edge_attributes["distance"]
+    pos  = g.get_positions()
+
+    expected = np.linalg.norm(
+        pos[g.edges_array[:, 0]] - pos[g.edges_array[:, 1]], axis=1)
+
+    assert np.allclose(dist, expected, rtol=1e-12, atol=0)
+
     # using the connector functions
     num_nodes = 20
 
@@ -432,6 +452,24 @@ def test_price():
     assert rmin < na.reciprocity(g) < rmax
 
 
+@pytest.mark.mpi_skip
+def test_reciprocity():
+    ''' Test reciprocity for Erdos-Renyi and random scale-free graphs '''
+    num_nodes = 1000
+    avg_deg   = 20
+    r         = 0.3
+
+    graphs = [
+        ng.erdos_renyi(nodes=num_nodes, avg_deg=avg_deg, reciprocity=r),
+        ng.random_scale_free(2.5, 2.5, nodes=num_nodes, avg_deg=avg_deg,
+                             reciprocity=r),
+    ]
+
+    for g in graphs:
+        assert g.edge_nb() == num_nodes*avg_deg
+        assert np.isclose(na.reciprocity(g), r, atol=0.01)
+
+
 @pytest.mark.mpi_skip
 def test_connect_switch_distance_rule_max_proba():
     num_omp = nngt.get_config("omp")
@@ -565,6 +603,38 @@ def test_sparse_clustered():
                     assert g.is_connected()
 
 
+@pytest.mark.mpi_skip
+def test_generate_copies():
+    ''' Check that generate does not share populations or shapes '''
+    pop = nngt.NeuralPop.exc_and_inhib(100)
+
+    instructions = {
+        "graph_type": "erdos_renyi", "avg_deg": 5, "population": pop
+    }
+
+    n1 = nngt.generate(instructions)
+    n2 = nngt.generate(instructions)
+
+    assert n1.population is not n2.population
+    assert n1.population is not pop
+
+    shape = nngt.geometry.Shape.disk(100)
+
+    instructions = {
+        "graph_type": "erdos_renyi", "nodes": 100, "avg_deg": 5,
+        "shape": shape
+    }
+
+    g1 = nngt.generate(instructions)
+    g2 = nngt.generate(instructions)
+
+    assert g1.shape is not g2.shape
+
+    del g2
+
+    assert g1.shape.parent is not None
+
+
 if __name__ == "__main__":
     if not nngt.get_config("mpi"):
         test_circular()
@@ -575,8 +645,10 @@ if __name__ == "__main__":
         test_all_to_all()
         test_distances()
         test_price()
+        test_reciprocity()
         test_connect_switch_distance_rule_max_proba()
         test_sparse_clustered()
+        test_generate_copies()
 
     if nngt.get_config("mpi"):
         test_mpi_from_degree_list()
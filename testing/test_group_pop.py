@@ -165,9 +165,48 @@ def test_group_structure():
                                    ignore_invalid=True)
 
 
+@pytest.mark.mpi_skip
+def test_copy_links():
+    ''' Check that copies of structures keep their links to the graph '''
+    import copy
+    import os
+
+    fname = os.path.join(os.path.dirname(os.path.abspath(__file__)), "s.nn")
+
+    for g in (nngt.Network.exc_and_inhib(50),
+              nngt.Graph(structure=nngt.Structure.from_groups(
+                  (nngt.Group(20), nngt.Group(30)), ("g1", "g2")))):
+        g.to_file(fname)
+
+        h = nngt.load_from_file(fname)
+
+        os.remove(fname)
+
+        struct = copy.deepcopy(h.structure)
+
+        assert struct == h.structure
+        assert struct.parent is h
+
+        for group in struct.values():
+            assert group._struct() is struct
+            assert group._net() is h
+
+        # saving does not modify the links
+        h.to_file(fname)
+
+        os.remove(fname)
+
+        assert h.structure.parent is h
+
+        for group in h.structure.values():
+            assert group._struct() is h.structure
+            assert group._net() is h
+
+
 if __name__ == "__main__":
     test_groups()
     test_add_nodes()
     test_population()
     test_failed_pop()
     test_group_structure()
+    test_copy_links()
@@ -29,9 +29,9 @@ from tools_testing import foreach_graph
 current_dir = os.path.dirname(os.path.abspath(__file__)) + '/'
 error = 'Wrong {{val}} for {graph}.'
 
-formats = ("neighbour", "edge_list", "gml", "graphml")
+formats = ("neighbour", "edge_list", "gml", "graphml", "csr")
 
-filetypes = ("nn", "el", "gml", "graphml")
+filetypes = ("nn", "el", "gml", "graphml", "npz")
 
 gfilename = current_dir + 'g.graph'
 
@@ -230,6 +230,48 @@ def test_str_attributes():
                               h.node_attributes["rnd"])
 
 
+@pytest.mark.mpi_skip
+def test_csr_pickle():
+    '''
+    Check that "csr" archives are only unpickled for object attributes.
+    '''
+    g = nngt.Graph(3)
+
+    g.new_edges([(0, 1), (1, 2)])
+    g.new_edge_attribute("type", "string", values=["a", "bc"])
+
+    g.to_file(gfilename, fmt="csr")
+
+    # string attributes are stored as fixed-width unicode
+    with np.load(gfilename, allow_pickle=False) as data:
+        assert data["ea_type"].dtype.kind == "U"
+
+    g.new_edge_attribute("obj", "object", values=[{"a": 1}, [1, 2]])
+
+    g.to_file(gfilename, fmt="csr")
+
+    h = nngt.load_from_file(gfilename, fmt="csr")
+
+    assert list(h.edge_attributes["obj"]) == [{"a": 1}, [1, 2]]
+    assert np.array_equal(g.edge_attributes["type"],
+                          h.edge_attributes["type"])
+
+
+@pytest.mark.mpi_skip
+def test_neighbour_uneven_stubs():
+    '''
+    Check that neighbour lines are parsed when only some stubs have
+    attributes.
+    '''
+    from nngt.io.loading_helpers import _get_edges_neighbour
+
+    lines = ["0 1 2;0.5", "1 0;1.5 2"]
+
+    edges = _get_edges_neighbour(lines, [], "#", "@", " ", ";", {}, {})
+
+    assert np.array_equal(edges, [(0, 1), (0, 2), (1, 0), (1, 2)])
+
+
 @pytest.mark.mpi_skip
 def test_structure():
     # with a structure
@@ -279,7 +321,7 @@ def test_spatial():
 
         tolerance = np.average(np.abs(h.shape.exterior.coords))*1e-5
 
-        assert np.all(np.isclose(g.get_positions(), h.get_positions()))
+        assert np.allclose(g.get_positions(), h.get_positions())
         assert g.shape.normalize().equals_exact(h.shape.normalize(), tolerance)
 
         for name, area in g.shape.areas.items():
@@ -326,6 +368,29 @@ def test_partial_graphml():
             assert g.get_edge_attributes(edges=e, name="eattr") == value
 
 
+@pytest.mark.mpi_skip
+def test_compressed():
+    ''' Check that compressed text files are read and written '''
+    g = nngt.Graph(5)
+
+    g.new_edges([(0, 1), (1, 3), (3, 2)])
+    g.new_edge_attribute("w", "double", values=[0.5, 1., 2.5])
+
+    for ft in filetypes[:-1]:
+        for comp in (".gz", ".bz2", ".xz"):
+            fname = current_dir + "test." + ft + comp
+
+            g.to_file(fname)
+
+            h = nngt.Graph.from_file(fname)
+
+            os.remove(fname)
+
+            assert np.array_equal(g.edges_array, h.edges_array)
+            assert np.array_equal(g.edge_attributes["w"],
+                                  h.edge_attributes["w"])
+
+
 # ---------- #
 # Test suite #
 # ---------- #
@@ -336,8 +401,11 @@ if __name__ == "__main__":
     if not nngt.get_config("mpi"):
         test_empty_out_degree()
         test_str_attributes()
+        test_csr_pickle()
+        test_neighbour_uneven_stubs()
         test_structure()
         test_node_attributes()
         test_spatial()
         test_partial_graphml()
+        test_compressed()
         unittest.main()
@@ -132,7 +132,41 @@ def test_utils():
     ns.plot_activity(vm, rec, show=True)
 
 
+@pytest.mark.skipif(nngt.get_config('mpi'), reason="Don't test for MPI")
+def test_raster_autoscale():
+    '''
+    Check that raster limits ignore the NaN separators between spikes.
+    '''
+    pytest.importorskip("nest")
+
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from nngt.simulation.nest_plot import _autoscale_raster, _raster_segments
+
+    times   = np.array([10., 20., 50.])
+    senders = np.array([3, 1, 8])
+
+    fig, ax = plt.subplots()
+
+    ax.plot(*_raster_segments(times, senders))
+
+    _autoscale_raster(ax)
+
+    xmin, xmax = ax.get_xlim()
+    ymin, ymax = ax.get_ylim()
+
+    assert np.all(np.isfinite((xmin, xmax, ymin, ymax)))
+    assert np.isclose(xmin, 10 - 0.02*40) and np.isclose(xmax, 50 + 0.02*40)
+    assert np.isclose(ymin, 0.6 - 0.02*7.8)
+    assert np.isclose(ymax, 8.4 + 0.02*7.8)
+
+    plt.close(fig)
+
+
 if __name__ == "__main__":
     if not nngt.get_config("mpi"):
         test_net_creation()
         test_utils()
+        test_raster_autoscale()
@@ -164,8 +164,8 @@ def test_clst_rewire():
     assert g.node_attributes == rc.node_attributes
     assert np.array_equal(g.node_attributes["random_int"],
                           rc.node_attributes["random_int"])
-    assert np.all(np.isclose(g.node_attributes["attr2"],
-                             rc.node_attributes["attr2"]))
+    assert np.allclose(g.node_attributes["attr2"],
+                       rc.node_attributes["attr2"])
     # check that attributes were moved together
     weights  = rc.get_weights()
     my_eattr = rc.edge_attributes["my-edge-attr"]